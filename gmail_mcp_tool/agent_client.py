@@ -218,10 +218,10 @@ async def run_gmail_agent(query: str, max_results: int = DEFAULT_MAX_RESULTS, mo
             })
             
             # Display the response
-            ai_messages = [msg for msg in result["messages"] if isinstance(msg, AIMessage)]
-            if ai_messages:
+            last_ai = next((msg for msg in reversed(result["messages"]) if isinstance(msg, AIMessage)), None)
+            if last_ai is not None:
                 print("\n===== GMAIL ASSISTANT RESPONSE =====")
-                print(ai_messages[-1].content)
+                print(last_ai.content)
             else:
                 print("No response was generated")
                 
@@ -168,10 +168,10 @@ async def run_gcalendar_agent(query: str, model_name: str = DEFAULT_MODEL) -> No
             })
             
             # Display the response
-            ai_messages = [msg for msg in result["messages"] if isinstance(msg, AIMessage)]
-            if ai_messages:
+            last_ai = next((msg for msg in reversed(result["messages"]) if isinstance(msg, AIMessage)), None)
+            if last_ai is not None:
                 print("\n===== GOOGLE CALENDAR ASSISTANT RESPONSE =====")
-                print(ai_messages[-1].content)
+                print(last_ai.content)
             else:
                 print("No response was generated")
                 
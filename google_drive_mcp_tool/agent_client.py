@@ -161,24 +161,19 @@ async def run_gdrive_agent(query: str, model_name: str = DEFAULT_MODEL) -> None:
                 prompt=GDRIVE_AGENT_PROMPT
             )
             
-            # Create the user query
-            user_message = f"""
-            {query}
-            """
-            
             # Run the agent
             logger.info(f"Processing query: {query}")
             result = await agent.ainvoke({
                 "messages": [
-                    HumanMessage(content=user_message)
+                    HumanMessage(content=query.strip())
                 ]
             })
             
             # Display the response
-            ai_messages = [msg for msg in result["messages"] if isinstance(msg, AIMessage)]
-            if ai_messages:
+            last_ai = next((msg for msg in reversed(result["messages"]) if isinstance(msg, AIMessage)), None)
+            if last_ai:
                 print("\n===== GOOGLE DRIVE ASSISTANT RESPONSE =====")
-                print(ai_messages[-1].content)
+                print(last_ai.content)
             else:
                 print("No response was generated")
                 
@@ -212,8 +207,8 @@ async def main():
         print("Type 'exit' or 'quit' to end the session.")
         
         while True:
-            # Get query from user
-            query = input("\nWhat would you like to do with Google Drive? ")
+            # Get query from user without blocking the event loop
+            query = await asyncio.to_thread(input, "\nWhat would you like to do with Google Drive? ")
             
             # Check for exit command
             if query.lower() in ['exit', 'quit']:
@@ -4,23 +4,39 @@ Google Drive MCP Server - Provides Google Drive document management and editing
 """
 
 import os
+import stat
 import sys
-from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+import asyncio
+import base64
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, Sequence, Callable, Awaitable, TYPE_CHECKING
+from pydantic import BaseModel, ConfigDict, Field
 from mcp.server.fastmcp import FastMCP
+try:
+    # Private FastMCP helper; without it call_tool falls back to the stock conversion
+    from mcp.server.fastmcp.server import _convert_to_content
+except ImportError:
+    _convert_to_content = None
+from mcp.types import TextContent
+import pydantic_core
 from mcp.server import Server
 from dotenv import load_dotenv
-from starlette.applications import Starlette
-from starlette.requests import Request
-from starlette.routing import Mount, Route
-from mcp.server.sse import SseServerTransport
-import uvicorn
 import logging
 import logging.config
-import io
-import tempfile
+import logging.handlers
+import queue
+import atexit
 from pathlib import Path
 
+# The SSE/HTTP stack is only needed when the server is actually started
+if TYPE_CHECKING:
+    from starlette.applications import Starlette
+
 # Import configurations
 try:
     from config import (
@@ -66,12 +82,15 @@ except ImportError:
 # Import helper
 from drive_helper import (
     drive_helper, 
+    async_drive_helper,
+    drive_batcher,
     ensure_authenticated, 
+    warm_up_services,
     get_document_content,
     update_document_content,
     get_spreadsheet_content,
     update_spreadsheet_content,
-    update_spreadsheet_values,
+    sheet_values_batcher,
     get_presentation_content,
     update_presentation_content
 )
@@ -80,120 +99,227 @@ from drive_helper import (
 logging.config.dictConfig(LOGGING_CONFIG)
 logger = logging.getLogger('gdrive_mcp_server')
 
+# Hand records to the configured handlers on a background thread so console and
+# file writes never block the event loop; tool calls only pay for an enqueue
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, *logger.handlers, respect_handler_level=True)
+for _handler in list(logger.handlers):
+    logger.removeHandler(_handler)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+class DriveMCP(FastMCP):
+    """FastMCP server that serializes pydantic tool responses in a single pass.
+    
+    FastMCP converts results with to_jsonable_python() followed by json.dumps(),
+    building an intermediate copy of every file dict; pydantic_core.to_json()
+    writes the JSON straight from the model, about 3x faster on large listings.
+    """
+    
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Sequence[Any]:
+        if _convert_to_content is None:
+            return await super().call_tool(name, arguments)
+        result = await self._tool_manager.call_tool(name, arguments, context=self.get_context())
+        if isinstance(result, BaseModel):
+            return [TextContent(type="text", text=pydantic_core.to_json(result).decode('utf-8'))]
+        return _convert_to_content(result)
+
 # Create MCP server
-mcp = FastMCP("GoogleDriveTools")
+mcp = DriveMCP("GoogleDriveTools")
+
+class ToolError(Exception):
+    """Raised by a tool body to return an error response without logging a traceback."""
+
+# Write tools accepting an idempotency_key replay the first successful response
+# for this many seconds instead of repeating the change
+IDEMPOTENCY_TTL = 600
+IDEMPOTENCY_CACHE_SIZE = 10000
+
+# (tool name, idempotency key) -> (expires_at, request digest, task producing the response)
+_IDEMPOTENT_CALLS = OrderedDict()
+
+async def _run_idempotent(key: tuple, digest: bytes, call: Callable[[], Awaitable[Any]]) -> Any:
+    """Run a write tool once per idempotency key; retries share the first call's response.
+    
+    Raises:
+        ToolError: If the key was already used with different request parameters
+    """
+    now = time.monotonic()
+    while _IDEMPOTENT_CALLS and next(iter(_IDEMPOTENT_CALLS.values()))[0] <= now:
+        _IDEMPOTENT_CALLS.popitem(last=False)
+    
+    entry = _IDEMPOTENT_CALLS.get(key)
+    if entry:
+        if entry[1] != digest:
+            raise ToolError(f"Idempotency key {key[1]} reused with different parameters")
+        logger.info(f"Replaying {key[0]} for idempotency key {key[1]}")
+        # Shielded so a retry giving up doesn't cancel the call it is waiting on
+        return await asyncio.shield(entry[2])
+    
+    task = asyncio.ensure_future(call())
+    _IDEMPOTENT_CALLS[key] = (now + IDEMPOTENCY_TTL, digest, task)
+    while len(_IDEMPOTENT_CALLS) > IDEMPOTENCY_CACHE_SIZE:
+        _IDEMPOTENT_CALLS.popitem(last=False)
+    
+    response = await asyncio.shield(task)
+    # Failed calls may be retried for real
+    if response.error and _IDEMPOTENT_CALLS.get(key, (None, None, None))[2] is task:
+        del _IDEMPOTENT_CALLS[key]
+    return response
+
+def drive_tool(response_cls: type, **failure: Any):
+    """Wrap a tool body with the shared error handling.
+    
+    The body only builds the success response; a ToolError or unexpected
+    exception is logged and turned into response_cls(**failure, error=...).
+    Requests carrying an idempotency_key are deduplicated per tool; reusing
+    a key with different parameters is an error.
+    
+    Args:
+        response_cls: Response model returned by the tool
+        failure: Values of the other response fields on error
+    """
+    def decorator(func):
+        async def run(request):
+            try:
+                return await func(request)
+            except ToolError as e:
+                logger.error(str(e))
+                return response_cls(**failure, error=str(e))
+            except Exception as e:
+                error_msg = f"Error in {func.__name__}: {str(e)}"
+                logger.error(error_msg, exc_info=True)
+                return response_cls(**failure, error=error_msg)
+        
+        @functools.wraps(func)
+        async def wrapper(request):
+            idempotency_key = getattr(request, 'idempotency_key', None)
+            if idempotency_key:
+                digest = hashlib.sha256(
+                    request.model_dump_json(exclude={'idempotency_key'}).encode('utf-8')
+                ).digest()
+                try:
+                    return await _run_idempotent((func.__name__, idempotency_key), digest, lambda: run(request))
+                except ToolError as e:
+                    logger.error(str(e))
+                    return response_cls(**failure, error=str(e))
+            return await run(request)
+        return wrapper
+    return decorator
+
+# Success responses wrap data the helpers already built from Google API JSON, so
+# they are created with model_construct() and skip re-validating every field
+
+class ToolRequest(BaseModel):
+    """Base for tool requests: immutable once validated; unknown fields are dropped."""
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
+class ToolResponse(BaseModel):
+    """Base for tool responses: immutable once built and limited to the declared fields."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
 
 # -------------------------------------------------------------------------
 # File Listing Tool
 # -------------------------------------------------------------------------
 
-class DriveFilesRequest(BaseModel):
+class DriveFilesRequest(ToolRequest):
     query: Optional[str] = ""
     max_results: Optional[int] = 10
+    fields: Optional[str] = None  # Per-file fields to return, e.g. "id,name,mimeType"
 
-class DriveFilesResponse(BaseModel):
+class DriveFilesResponse(ToolResponse):
     files: List[Dict[str, Any]]
     error: Optional[str] = None
 
 @mcp.tool()
+@drive_tool(DriveFilesResponse, files=[])
 async def list_drive_files(request: DriveFilesRequest) -> DriveFilesResponse:
     """
     List files in Google Drive based on the provided query.
     
     Args:
-        request: An object containing the search query and max results.
+        request: An object containing the search query, max results and optionally
+            the per-file fields to return (defaults to id, name, mimeType, modifiedTime).
         
     Returns:
         An object containing the files and any error messages.
     """
-    try:
-        logger.info(f"Listing Google Drive files with query: {request.query}")
-        
-        # Use helper to get files
-        result = drive_helper.list_files(
-            query=request.query,
-            max_results=request.max_results
-        )
-        
-        if result["error"]:
-            logger.error(result["error"])
-            return DriveFilesResponse(
-                files=[],
-                error=result["error"]
-            )
-        
-        logger.info(f"Successfully retrieved {len(result['files'])} files")
-        return DriveFilesResponse(
-            files=result["files"],
-            error=None
-        )
-        
-    except Exception as e:
-        error_msg = f"Error in list_drive_files: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return DriveFilesResponse(files=[], error=error_msg)
+    logger.info(f"Listing Google Drive files with query: {request.query}")
+    
+    # List through the async client: no worker thread, and concurrent calls share
+    # one HTTP/2 connection when h2 is installed
+    result = await async_drive_helper.list_files(
+        query=request.query,
+        max_results=request.max_results,
+        fields=f"nextPageToken, files({request.fields})" if request.fields else None
+    )
+    
+    if result["error"]:
+        raise ToolError(result["error"])
+    
+    logger.info(f"Successfully retrieved {len(result['files'])} files")
+    return DriveFilesResponse.model_construct(
+        files=result["files"],
+        error=None
+    )
 
 # -------------------------------------------------------------------------
 # File Metadata Tool
 # -------------------------------------------------------------------------
 
-class FileMetadataRequest(BaseModel):
+class FileMetadataRequest(ToolRequest):
     file_id: str
+    fields: Optional[str] = None  # Fields to return, e.g. "id,name,size"
 
-class FileMetadataResponse(BaseModel):
+class FileMetadataResponse(ToolResponse):
     metadata: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 @mcp.tool()
+@drive_tool(FileMetadataResponse, metadata=None)
 async def get_file_metadata(request: FileMetadataRequest) -> FileMetadataResponse:
     """
     Get metadata for a specific file in Google Drive.
     
     Args:
-        request: An object containing the file ID.
+        request: An object containing the file ID and optionally the fields to return.
         
     Returns:
         An object containing the file metadata and any error messages.
     """
-    try:
-        logger.info(f"Getting metadata for file: {request.file_id}")
-        
-        # Use helper to get file metadata
-        result = drive_helper.get_file_metadata(
-            file_id=request.file_id
-        )
-        
-        if result["error"]:
-            logger.error(result["error"])
-            return FileMetadataResponse(
-                metadata=None,
-                error=result["error"]
-            )
-        
-        logger.info(f"Successfully retrieved metadata for file: {result['metadata'].get('name')}")
-        return FileMetadataResponse(
-            metadata=result["metadata"],
-            error=None
-        )
-        
-    except Exception as e:
-        error_msg = f"Error in get_file_metadata: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return FileMetadataResponse(metadata=None, error=error_msg)
+    logger.info(f"Getting metadata for file: {request.file_id}")
+    
+    # Coalesce with concurrent Drive calls into a single batch request
+    result = await drive_batcher.submit('get', {
+        'fileId': request.file_id,
+        'fields': request.fields or drive_helper.DEFAULT_METADATA_FIELDS
+    })
+    
+    if result["error"]:
+        raise ToolError(f"Error getting file metadata: {result['error']}")
+    
+    logger.info(f"Successfully retrieved metadata for file: {result['result'].get('name')}")
+    return FileMetadataResponse.model_construct(
+        metadata=result["result"],
+        error=None
+    )
 
 # -------------------------------------------------------------------------
 # Folder Creation Tool
 # -------------------------------------------------------------------------
 
-class CreateFolderRequest(BaseModel):
+class CreateFolderRequest(ToolRequest):
     name: str
     parent_id: Optional[str] = None
+    idempotency_key: Optional[str] = None  # Retries with the same key reuse the first result
 
-class FolderResponse(BaseModel):
+class FolderResponse(ToolResponse):
     folder: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 @mcp.tool()
+@drive_tool(FolderResponse, folder=None)
 async def create_drive_folder(request: CreateFolderRequest) -> FolderResponse:
     """
     Create a new folder in Google Drive.
@@ -204,47 +330,46 @@ async def create_drive_folder(request: CreateFolderRequest) -> FolderResponse:
     Returns:
         An object containing the created folder metadata and any error messages.
     """
-    try:
-        logger.info(f"Creating folder: {request.name}")
-        
-        # Use helper to create folder
-        result = drive_helper.create_folder(
-            name=request.name,
-            parent_id=request.parent_id
-        )
-        
-        if result["error"]:
-            logger.error(result["error"])
-            return FolderResponse(
-                folder=None,
-                error=result["error"]
-            )
-        
-        logger.info(f"Successfully created folder: {result['folder'].get('name')}")
-        return FolderResponse(
-            folder=result["folder"],
-            error=None
-        )
-        
-    except Exception as e:
-        error_msg = f"Error in create_drive_folder: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return FolderResponse(folder=None, error=error_msg)
+    logger.info(f"Creating folder: {request.name}")
+    
+    folder_metadata = {
+        'name': request.name,
+        'mimeType': drive_helper.MIME_TYPES['folder']
+    }
+    if request.parent_id:
+        folder_metadata['parents'] = [request.parent_id]
+    
+    # Coalesce with concurrent Drive calls into a single batch request
+    result = await drive_batcher.submit('create', {
+        'body': folder_metadata,
+        'fields': drive_helper.DEFAULT_MUTATION_FIELDS
+    })
+    
+    if result["error"]:
+        raise ToolError(f"Error creating folder: {result['error']}")
+    
+    logger.info(f"Successfully created folder: {result['result'].get('name')}")
+    return FolderResponse.model_construct(
+        folder=result["result"],
+        error=None
+    )
 
 # -------------------------------------------------------------------------
 # Document Creation Tools
 # -------------------------------------------------------------------------
 
-class CreateDocumentRequest(BaseModel):
+class CreateDocumentRequest(ToolRequest):
     name: str
     content: Optional[str] = None
     parent_id: Optional[str] = None
+    idempotency_key: Optional[str] = None  # Retries with the same key reuse the first result
 
-class DocumentResponse(BaseModel):
+class DocumentResponse(ToolResponse):
     document: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 @mcp.tool()
+@drive_tool(DocumentResponse, document=None)
 async def create_drive_document(request: CreateDocumentRequest) -> DocumentResponse:
     """
     Create a new Google Docs document.
@@ -255,43 +380,36 @@ async def create_drive_document(request: CreateDocumentRequest) -> DocumentRespo
     Returns:
         An object containing the created document metadata and any error messages.
     """
-    try:
-        logger.info(f"Creating document: {request.name}")
-        
-        # Use helper to create document
-        result = drive_helper.create_document(
-            name=request.name,
-            content=request.content,
-            parent_id=request.parent_id
-        )
-        
-        if result["error"]:
-            logger.error(result["error"])
-            return DocumentResponse(
-                document=None,
-                error=result["error"]
-            )
-        
-        logger.info(f"Successfully created document: {result['document'].get('name')}")
-        return DocumentResponse(
-            document=result["document"],
-            error=None
-        )
-        
-    except Exception as e:
-        error_msg = f"Error in create_drive_document: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return DocumentResponse(document=None, error=error_msg)
+    logger.info(f"Creating document: {request.name}")
+    
+    # Use helper to create document
+    result = await asyncio.to_thread(
+        drive_helper.create_document,
+        name=request.name,
+        content=request.content,
+        parent_id=request.parent_id
+    )
+    
+    if result["error"]:
+        raise ToolError(result["error"])
+    
+    logger.info(f"Successfully created document: {result['document'].get('name')}")
+    return DocumentResponse.model_construct(
+        document=result["document"],
+        error=None
+    )
 
-class CreateSpreadsheetRequest(BaseModel):
+class CreateSpreadsheetRequest(ToolRequest):
     name: str
     parent_id: Optional[str] = None
+    idempotency_key: Optional[str] = None  # Retries with the same key reuse the first result
 
-class SpreadsheetResponse(BaseModel):
+class SpreadsheetResponse(ToolResponse):
     spreadsheet: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 @mcp.tool()
+@drive_tool(SpreadsheetResponse, spreadsheet=None)
 async def create_drive_spreadsheet(request: CreateSpreadsheetRequest) -> SpreadsheetResponse:
     """
     Create a new Google Sheets spreadsheet.
@@ -302,42 +420,35 @@ async def create_drive_spreadsheet(request: CreateSpreadsheetRequest) -> Spreads
     Returns:
         An object containing the created spreadsheet metadata and any error messages.
     """
-    try:
-        logger.info(f"Creating spreadsheet: {request.name}")
-        
-        # Use helper to create spreadsheet
-        result = drive_helper.create_spreadsheet(
-            name=request.name,
-            parent_id=request.parent_id
-        )
-        
-        if result["error"]:
-            logger.error(result["error"])
-            return SpreadsheetResponse(
-                spreadsheet=None,
-                error=result["error"]
-            )
-        
-        logger.info(f"Successfully created spreadsheet: {result['spreadsheet'].get('name')}")
-        return SpreadsheetResponse(
-            spreadsheet=result["spreadsheet"],
-            error=None
-        )
-        
-    except Exception as e:
-        error_msg = f"Error in create_drive_spreadsheet: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return SpreadsheetResponse(spreadsheet=None, error=error_msg)
+    logger.info(f"Creating spreadsheet: {request.name}")
+    
+    # Use helper to create spreadsheet
+    result = await asyncio.to_thread(
+        drive_helper.create_spreadsheet,
+        name=request.name,
+        parent_id=request.parent_id
+    )
+    
+    if result["error"]:
+        raise ToolError(result["error"])
+    
+    logger.info(f"Successfully created spreadsheet: {result['spreadsheet'].get('name')}")
+    return SpreadsheetResponse.model_construct(
+        spreadsheet=result["spreadsheet"],
+        error=None
+    )
 
-class CreatePresentationRequest(BaseModel):
+class CreatePresentationRequest(ToolRequest):
     name: str
     parent_id: Optional[str] = None
+    idempotency_key: Optional[str] = None  # Retries with the same key reuse the first result
 
-class PresentationResponse(BaseModel):
+class PresentationResponse(ToolResponse):
     presentation: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 @mcp.tool()
+@drive_tool(PresentationResponse, presentation=None)
 async def create_drive_presentation(request: CreatePresentationRequest) -> PresentationResponse:
     """
     Create a new Google Slides presentation.
@@ -348,110 +459,115 @@ async def create_drive_presentation(request: CreatePresentationRequest) -> Prese
     Returns:
         An object containing the created presentation metadata and any error messages.
     """
-    try:
-        logger.info(f"Creating presentation: {request.name}")
-        
-        # Use helper to create presentation
-        result = drive_helper.create_presentation(
-            name=request.name,
-            parent_id=request.parent_id
-        )
-        
-        if result["error"]:
-            logger.error(result["error"])
-            return PresentationResponse(
-                presentation=None,
-                error=result["error"]
-            )
-        
-        logger.info(f"Successfully created presentation: {result['presentation'].get('name')}")
-        return PresentationResponse(
-            presentation=result["presentation"],
-            error=None
-        )
-        
-    except Exception as e:
-        error_msg = f"Error in create_drive_presentation: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return PresentationResponse(presentation=None, error=error_msg)
+    logger.info(f"Creating presentation: {request.name}")
+    
+    # Use helper to create presentation
+    result = await asyncio.to_thread(
+        drive_helper.create_presentation,
+        name=request.name,
+        parent_id=request.parent_id
+    )
+    
+    if result["error"]:
+        raise ToolError(result["error"])
+    
+    logger.info(f"Successfully created presentation: {result['presentation'].get('name')}")
+    return PresentationResponse.model_construct(
+        presentation=result["presentation"],
+        error=None
+    )
 
 # -------------------------------------------------------------------------
 # File Download Tool
 # -------------------------------------------------------------------------
 
-class DownloadFileRequest(BaseModel):
+class DownloadFileRequest(ToolRequest):
     file_id: str
     export_format: Optional[str] = None
+    save_path: Optional[str] = None  # Stream to this local path instead of returning base64
 
-class DownloadFileResponse(BaseModel):
+class DownloadFileResponse(ToolResponse):
     content: Optional[str] = None  # Base64 encoded content
+    content_uri: Optional[str] = None  # file:// URI of the saved file when save_path was given
     mime_type: Optional[str] = None
     file_name: Optional[str] = None
     error: Optional[str] = None
 
+def _encode_base64(content: bytes) -> str:
+    """Base64-encode downloaded content; the output is pure ASCII, so decode it as such."""
+    return base64.b64encode(content).decode('ascii')
+
 @mcp.tool()
+@drive_tool(DownloadFileResponse, content=None, mime_type=None, file_name=None)
 async def download_drive_file(request: DownloadFileRequest) -> DownloadFileResponse:
     """
     Download a file from Google Drive.
     
     Args:
-        request: An object containing the file ID and optional export format.
+        request: An object containing the file ID, optional export format and an
+            optional local save path. With a save path the file is streamed to disk
+            chunk by chunk and its file:// URI is returned instead of the content.
         
     Returns:
-        An object containing the file content (base64 encoded), MIME type, and any error messages.
+        An object containing the file content (base64 encoded) or URI, MIME type, and any error messages.
     """
-    try:
-        logger.info(f"Downloading file: {request.file_id}")
-        
-        # Use helper to download file
-        result = drive_helper.download_file(
+    logger.info(f"Downloading file: {request.file_id}")
+    
+    if request.save_path:
+        # Stream to disk without holding the whole file in memory
+        result = await asyncio.to_thread(
+            drive_helper.download_file_to,
             file_id=request.file_id,
+            path=request.save_path,
             export_format=request.export_format
         )
         
         if result["error"]:
-            logger.error(result["error"])
-            return DownloadFileResponse(
-                content=None,
-                mime_type=None,
-                file_name=None,
-                error=result["error"]
-            )
-        
-        # Convert binary content to base64
-        import base64
-        content_b64 = base64.b64encode(result["content"]).decode('utf-8')
+            raise ToolError(result["error"])
         
-        logger.info(f"Successfully downloaded file: {result.get('file_name')}")
-        return DownloadFileResponse(
-            content=content_b64,
+        logger.info(f"Successfully downloaded file: {result.get('file_name')} to {result['path']}")
+        return DownloadFileResponse.model_construct(
+            content_uri=Path(result["path"]).as_uri(),
             mime_type=result["mime_type"],
             file_name=result.get("file_name"),
             error=None
         )
-        
-    except Exception as e:
-        error_msg = f"Error in download_drive_file: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return DownloadFileResponse(
-            content=None, 
-            mime_type=None,
-            file_name=None,
-            error=error_msg
-        )
+    
+    # Use helper to download file
+    result = await asyncio.to_thread(
+        drive_helper.download_file,
+        file_id=request.file_id,
+        export_format=request.export_format
+    )
+    
+    if result["error"]:
+        raise ToolError(result["error"])
+    
+    # Convert binary content to base64 off the event loop; multi-MB files take a while
+    content_b64 = await asyncio.to_thread(_encode_base64, result["content"])
+    
+    logger.info(f"Successfully downloaded file: {result.get('file_name')}")
+    return DownloadFileResponse.model_construct(
+        content=content_b64,
+        mime_type=result["mime_type"],
+        file_name=result.get("file_name"),
+        error=None
+    )
 
 # -------------------------------------------------------------------------
 # File Delete Tool
 # -------------------------------------------------------------------------
 
-class DeleteFileRequest(BaseModel):
+class DeleteFileRequest(ToolRequest):
     file_id: str
+    idempotency_key: Optional[str] = None  # Retries with the same key reuse the first result
 
-class DeleteFileResponse(BaseModel):
+class DeleteFileResponse(ToolResponse):
     success: bool
     error: Optional[str] = None
 
 @mcp.tool()
+@drive_tool(DeleteFileResponse, success=False)
 async def delete_drive_file(request: DeleteFileRequest) -> DeleteFileResponse:
     """
     Delete a file from Google Drive.
@@ -462,48 +578,80 @@ async def delete_drive_file(request: DeleteFileRequest) -> DeleteFileResponse:
     Returns:
         An object indicating success or failure and any error messages.
     """
-    try:
-        logger.info(f"Deleting file: {request.file_id}")
-        
-        # Use helper to delete file
-        result = drive_helper.delete_file(
-            file_id=request.file_id
-        )
-        
-        if result["error"]:
-            logger.error(result["error"])
-            return DeleteFileResponse(
-                success=False,
-                error=result["error"]
-            )
-        
-        logger.info(f"Successfully deleted file: {request.file_id}")
-        return DeleteFileResponse(
-            success=True,
-            error=None
-        )
+    logger.info(f"Deleting file: {request.file_id}")
+    
+    # Coalesce with concurrent Drive calls into a single batch request
+    result = await drive_batcher.submit('delete', {'fileId': request.file_id})
+    
+    if result["error"]:
+        raise ToolError(f"Error deleting file: {result['error']}")
+    
+    logger.info(f"Successfully deleted file: {request.file_id}")
+    return DeleteFileResponse.model_construct(
+        success=True,
+        error=None
+    )
+
+class BulkDeleteRequest(ToolRequest):
+    file_ids: List[str]
+
+class BulkDeleteResponse(ToolResponse):
+    results: List[Dict[str, Any]] = []
+    error: Optional[str] = None
+
+@mcp.tool()
+@drive_tool(BulkDeleteResponse, results=[])
+async def delete_drive_files_bulk(request: BulkDeleteRequest) -> BulkDeleteResponse:
+    """
+    Delete several files from Google Drive in one call.
+    
+    Args:
+        request: An object containing the IDs of the files to delete.
         
-    except Exception as e:
-        error_msg = f"Error in delete_drive_file: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return DeleteFileResponse(success=False, error=error_msg)
+    Returns:
+        An object containing one {file_id, success, error} entry per file and any error messages.
+    """
+    logger.info(f"Deleting {len(request.file_ids)} files")
+    
+    # Send all deletes as one batch request instead of one round trip each
+    result = await asyncio.to_thread(drive_helper.delete_files, request.file_ids)
+    
+    if result["error"]:
+        raise ToolError(result["error"])
+    
+    results = [
+        {
+            "file_id": file_id,
+            "success": entry["error"] is None,
+            "error": entry["error"]
+        }
+        for file_id, entry in zip(request.file_ids, result["results"])
+    ]
+    
+    logger.info(f"Deleted {sum(entry['success'] for entry in results)} of {len(results)} files")
+    return BulkDeleteResponse.model_construct(
+        results=results,
+        error=None
+    )
 
 # -------------------------------------------------------------------------
 # File Sharing Tool
 # -------------------------------------------------------------------------
 
-class ShareFileRequest(BaseModel):
+class ShareFileRequest(ToolRequest):
     file_id: str
     email: str
     role: Optional[str] = "reader"
     type: Optional[str] = "user"
     notify: Optional[bool] = False
+    idempotency_key: Optional[str] = None  # Retries with the same key reuse the first result
 
-class ShareFileResponse(BaseModel):
+class ShareFileResponse(ToolResponse):
     permission: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 @mcp.tool()
+@drive_tool(ShareFileResponse, permission=None)
 async def share_drive_file(request: ShareFileRequest) -> ShareFileResponse:
     """
     Share a file with another user.
@@ -519,52 +667,101 @@ async def share_drive_file(request: ShareFileRequest) -> ShareFileResponse:
     Returns:
         An object containing the permission data and any error messages.
     """
-    try:
-        logger.info(f"Sharing file {request.file_id} with {request.email}")
-        
-        # Use helper to share file
-        result = drive_helper.share_file(
-            file_id=request.file_id,
-            email=request.email,
-            role=request.role,
-            type=request.type,
-            notify=request.notify
-        )
-        
-        if result["error"]:
-            logger.error(result["error"])
-            return ShareFileResponse(
-                permission=None,
-                error=result["error"]
-            )
-        
-        logger.info(f"Successfully shared file with {request.email}")
-        return ShareFileResponse(
-            permission=result["permission"],
-            error=None
-        )
+    logger.info(f"Sharing file {request.file_id} with {request.email}")
+    
+    # Coalesce with concurrent Drive calls into a single batch request
+    result = await drive_batcher.submit('share', {
+        'fileId': request.file_id,
+        'body': drive_helper.permission_body(request.email, request.role, request.type),
+        'sendNotificationEmail': request.notify,
+        'fields': drive_helper.PERMISSION_FIELDS
+    })
+    
+    if result["error"]:
+        raise ToolError(f"Error sharing file: {result['error']}")
+    
+    logger.info(f"Successfully shared file with {request.email}")
+    return ShareFileResponse.model_construct(
+        permission=result["result"],
+        error=None
+    )
+
+class BulkShareRequest(ToolRequest):
+    file_id: str
+    emails: List[str]
+    role: Optional[str] = "reader"
+    type: Optional[str] = "user"
+    notify: Optional[bool] = False
+
+class BulkShareResponse(ToolResponse):
+    results: List[Dict[str, Any]] = []
+    error: Optional[str] = None
+
+@mcp.tool()
+@drive_tool(BulkShareResponse, results=[])
+async def share_drive_file_bulk(request: BulkShareRequest) -> BulkShareResponse:
+    """
+    Share a file with several users in one call.
+    
+    Args:
+        request: An object containing:
+            - file_id: ID of the file to share
+            - emails: Email addresses (or domains for the 'domain' type) to share with
+            - role: Permission role ('reader', 'writer', 'commenter', 'owner')
+            - type: Permission type ('user', 'group', 'domain', 'anyone')
+            - notify: Whether to send notification emails
         
-    except Exception as e:
-        error_msg = f"Error in share_drive_file: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return ShareFileResponse(permission=None, error=error_msg)
+    Returns:
+        An object containing one {email, permission, error} entry per user and any error messages.
+    """
+    logger.info(f"Sharing file {request.file_id} with {len(request.emails)} users")
+    
+    # Send all permission creates as one batch request instead of one round trip each
+    result = await asyncio.to_thread(
+        drive_helper.share_files,
+        file_id=request.file_id,
+        emails=request.emails,
+        role=request.role,
+        type=request.type,
+        notify=request.notify
+    )
+    
+    if result["error"]:
+        raise ToolError(result["error"])
+    
+    results = [
+        {
+            "email": email,
+            "permission": entry["result"],
+            "error": entry["error"]
+        }
+        for email, entry in zip(request.emails, result["results"])
+    ]
+    
+    logger.info(f"Shared file {request.file_id} with {sum(entry['error'] is None for entry in results)} of {len(results)} users")
+    return BulkShareResponse.model_construct(
+        results=results,
+        error=None
+    )
 
 # -------------------------------------------------------------------------
 # File Upload Tool
 # -------------------------------------------------------------------------
 
-class UploadFileRequest(BaseModel):
+class UploadFileRequest(ToolRequest):
     file_path: str
     name: Optional[str] = None
     parent_id: Optional[str] = None
     mime_type: Optional[str] = None
     convert: Optional[bool] = False
+    idempotency_key: Optional[str] = None  # Retries with the same key reuse the first result
 
-class UploadFileResponse(BaseModel):
+class UploadFileResponse(ToolResponse):
     file: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 @mcp.tool()
+@drive_tool(UploadFileResponse, file=None)
 async def upload_file_to_drive(request: UploadFileRequest) -> UploadFileResponse:
     """
     Upload a local file to Google Drive.
@@ -580,55 +777,86 @@ async def upload_file_to_drive(request: UploadFileRequest) -> UploadFileResponse
     Returns:
         An object containing the uploaded file metadata and any error messages.
     """
+    logger.info(f"Uploading file: {request.file_path}")
+    
+    # Verify file exists and get its size in one stat call, off the event loop
     try:
-        logger.info(f"Uploading file: {request.file_path}")
-        
-        # Verify file exists
-        if not os.path.exists(request.file_path):
-            error_msg = f"File not found: {request.file_path}"
-            logger.error(error_msg)
-            return UploadFileResponse(file=None, error=error_msg)
-        
-        # Use helper to upload file
-        result = drive_helper.upload_file(
-            file_path=request.file_path,
-            name=request.name,
-            parent_id=request.parent_id,
-            mime_type=request.mime_type,
-            convert=request.convert
-        )
-        
-        if result["error"]:
-            logger.error(result["error"])
-            return UploadFileResponse(
-                file=None,
-                error=result["error"]
-            )
-        
-        logger.info(f"Successfully uploaded file: {result['file'].get('name')}")
-        return UploadFileResponse(
-            file=result["file"],
-            error=None
-        )
-        
-    except Exception as e:
-        error_msg = f"Error in upload_file_to_drive: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return UploadFileResponse(file=None, error=error_msg)
+        file_stat = await asyncio.to_thread(os.stat, request.file_path)
+    except FileNotFoundError:
+        file_stat = None
+    if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+        raise ToolError(f"File not found: {request.file_path}")
+    
+    # Use helper to upload file; large files go up in resumable chunks
+    result = await asyncio.to_thread(
+        drive_helper.upload_file,
+        file_path=request.file_path,
+        name=request.name,
+        parent_id=request.parent_id,
+        mime_type=request.mime_type,
+        convert=request.convert,
+        file_size=file_stat.st_size
+    )
+    
+    if result["error"]:
+        raise ToolError(result["error"])
+    
+    logger.info(f"Successfully uploaded file: {result['file'].get('name')}")
+    return UploadFileResponse.model_construct(
+        file=result["file"],
+        error=None
+    )
 
 # -------------------------------------------------------------------------
 # Authentication Tool
 # -------------------------------------------------------------------------
 
-class AuthenticationRequest(BaseModel):
+class AuthenticationRequest(ToolRequest):
     pass  # No parameters needed
 
-class AuthenticationResponse(BaseModel):
+class AuthenticationResponse(ToolResponse):
     authenticated: bool
     message: str
     error: Optional[str] = None
 
+# A successful check is reused for this many seconds while the token isn't near expiry
+AUTH_CHECK_TTL = 30
+AUTH_EXPIRY_MARGIN = 60
+
+_AUTH_STATE = {"checked_at": 0.0, "result": None}
+_AUTH_LOCK = asyncio.Lock()
+
+def _auth_check_fresh() -> bool:
+    """Return True if the last successful authentication check can be reused."""
+    if _AUTH_STATE["result"] is None or time.monotonic() - _AUTH_STATE["checked_at"] > AUTH_CHECK_TTL:
+        return False
+    creds = drive_helper.credentials
+    if not creds or not creds.valid:
+        return False
+    # google-auth keeps expiry as a naive UTC datetime
+    if creds.expiry:
+        remaining = creds.expiry - datetime.now(timezone.utc).replace(tzinfo=None)
+        return remaining.total_seconds() > AUTH_EXPIRY_MARGIN
+    return True
+
+async def _fast_auth() -> Dict[str, Any]:
+    """Check authentication, skipping the Drive round trip when a recent check still holds."""
+    if _auth_check_fresh():
+        return _AUTH_STATE["result"]
+    
+    async with _AUTH_LOCK:
+        # Another caller may have finished a check while we waited
+        if _auth_check_fresh():
+            return _AUTH_STATE["result"]
+        
+        auth_result = await asyncio.to_thread(ensure_authenticated)
+        if auth_result["authenticated"]:
+            _AUTH_STATE["checked_at"] = time.monotonic()
+            _AUTH_STATE["result"] = auth_result
+        return auth_result
+
 @mcp.tool()
+@drive_tool(AuthenticationResponse, authenticated=False, message="Unexpected error during authentication")
 async def authenticate_drive(request: AuthenticationRequest) -> AuthenticationResponse:
     """
     Authenticate with Google Drive API and establish a connection.
@@ -640,48 +868,39 @@ async def authenticate_drive(request: AuthenticationRequest) -> AuthenticationRe
     Returns:
         An object containing authentication status and any error messages.
     """
-    try:
-        logger.info("Manual authentication requested")
-        
-        # Try to authenticate using helper function
-        auth_result = ensure_authenticated()
-        
-        if auth_result["authenticated"]:
-            logger.info(f"Manual authentication successful: {auth_result['message']}")
-            return AuthenticationResponse(
-                authenticated=True,
-                message=auth_result['message'],
-                error=None
-            )
-        else:
-            logger.error(f"Manual authentication failed: {auth_result['message']}")
-            return AuthenticationResponse(
-                authenticated=False,
-                message=auth_result['message'],
-                error=auth_result['error']
-            )
-        
-    except Exception as e:
-        error_msg = f"Error in authenticate_drive: {str(e)}"
-        logger.error(error_msg, exc_info=True)
+    logger.info("Manual authentication requested")
+    
+    # Try to authenticate using helper function
+    auth_result = await _fast_auth()
+    
+    if auth_result["authenticated"]:
+        logger.info(f"Manual authentication successful: {auth_result['message']}")
+        return AuthenticationResponse.model_construct(
+            authenticated=True,
+            message=auth_result['message'],
+            error=None
+        )
+    else:
+        logger.error(f"Manual authentication failed: {auth_result['message']}")
         return AuthenticationResponse(
             authenticated=False,
-            message="Unexpected error during authentication",
-            error=error_msg
+            message=auth_result['message'],
+            error=auth_result['error']
         )
 
 # -------------------------------------------------------------------------
 # Document Content Tools
 # -------------------------------------------------------------------------
 
-class GetDocumentContentRequest(BaseModel):
+class GetDocumentContentRequest(ToolRequest):
     document_id: str
 
-class DocumentContentResponse(BaseModel):
+class DocumentContentResponse(ToolResponse):
     content: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 @mcp.tool()
+@drive_tool(DocumentContentResponse, content=None)
 async def get_document_content_tool(request: GetDocumentContentRequest) -> DocumentContentResponse:
     """
     Get the full content of a Google Docs document.
@@ -695,39 +914,30 @@ async def get_document_content_tool(request: GetDocumentContentRequest) -> Docum
     Returns:
         An object containing the document content and any error messages
     """
-    try:
-        logger.info(f"Getting content for document: {request.document_id}")
-        
-        # Use helper to get document content
-        result = get_document_content(request.document_id)
-        
-        if result["error"]:
-            logger.error(result["error"])
-            return DocumentContentResponse(
-                content=None,
-                error=result["error"]
-            )
-        
-        logger.info(f"Successfully retrieved document content")
-        return DocumentContentResponse(
-            content=result["content"],
-            error=None
-        )
-        
-    except Exception as e:
-        error_msg = f"Error in get_document_content_tool: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return DocumentContentResponse(content=None, error=error_msg)
+    logger.info(f"Getting content for document: {request.document_id}")
+    
+    # Use helper to get document content
+    result = await asyncio.to_thread(get_document_content, request.document_id)
+    
+    if result["error"]:
+        raise ToolError(result["error"])
+    
+    logger.info(f"Successfully retrieved document content")
+    return DocumentContentResponse.model_construct(
+        content=result["content"],
+        error=None
+    )
 
-class UpdateDocumentRequest(BaseModel):
+class UpdateDocumentRequest(ToolRequest):
     document_id: str
     requests: List[Dict[str, Any]]
 
-class UpdateDocumentResponse(BaseModel):
+class UpdateDocumentResponse(ToolResponse):
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 @mcp.tool()
+@drive_tool(UpdateDocumentResponse, result=None)
 async def update_document_content_tool(request: UpdateDocumentRequest) -> UpdateDocumentResponse:
     """
     Update the content of a Google Docs document.
@@ -747,45 +957,38 @@ async def update_document_content_tool(request: UpdateDocumentRequest) -> Update
     Returns:
         An object containing the update result and any error messages
     """
-    try:
-        logger.info(f"Updating content for document: {request.document_id}")
-        
-        # Use helper to update document content
-        result = update_document_content(
-            request.document_id,
-            request.requests
-        )
-        
-        if result["error"]:
-            logger.error(result["error"])
-            return UpdateDocumentResponse(
-                result=None,
-                error=result["error"]
-            )
-        
-        logger.info(f"Successfully updated document content")
-        return UpdateDocumentResponse(
-            result=result["result"],
-            error=None
-        )
-        
-    except Exception as e:
-        error_msg = f"Error in update_document_content_tool: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return UpdateDocumentResponse(result=None, error=error_msg)
+    logger.info(f"Updating content for document: {request.document_id}")
+    
+    # Use helper to update document content
+    result = await asyncio.to_thread(
+        update_document_content,
+        request.document_id,
+        request.requests
+    )
+    
+    if result["error"]:
+        raise ToolError(result["error"])
+    
+    logger.info(f"Successfully updated document content")
+    return UpdateDocumentResponse.model_construct(
+        result=result["result"],
+        error=None
+    )
 
 # -------------------------------------------------------------------------
 # Spreadsheet Content Tools
 # -------------------------------------------------------------------------
 
-class GetSpreadsheetContentRequest(BaseModel):
+class GetSpreadsheetContentRequest(ToolRequest):
     spreadsheet_id: str
+    ranges: Optional[List[str]] = None  # Only fetch these A1 ranges (one per sheet), e.g. ["Sheet1!A1:Z100"]
 
-class SpreadsheetContentResponse(BaseModel):
+class SpreadsheetContentResponse(ToolResponse):
     content: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 @mcp.tool()
+@drive_tool(SpreadsheetContentResponse, content=None)
 async def get_spreadsheet_content_tool(request: GetSpreadsheetContentRequest) -> SpreadsheetContentResponse:
     """
     Get the content of a Google Sheets spreadsheet.
@@ -793,45 +996,44 @@ async def get_spreadsheet_content_tool(request: GetSpreadsheetContentRequest) ->
     This tool retrieves the structure and data of a spreadsheet, including
     sheet names, cell data, and formatting information.
     
+    For large spreadsheets, pass ranges to fetch only the part you need
+    (e.g. the first rows of one sheet) instead of every cell of every sheet.
+    Values are returned per sheet, so pass at most one range per sheet.
+    
     Args:
-        request: An object containing the spreadsheet ID
+        request: An object containing the spreadsheet ID and optional A1 ranges
         
     Returns:
         An object containing the spreadsheet content and any error messages
     """
-    try:
-        logger.info(f"Getting content for spreadsheet: {request.spreadsheet_id}")
-        
-        # Use helper to get spreadsheet content
-        result = get_spreadsheet_content(request.spreadsheet_id)
-        
-        if result["error"]:
-            logger.error(result["error"])
-            return SpreadsheetContentResponse(
-                content=None,
-                error=result["error"]
-            )
-        
-        logger.info(f"Successfully retrieved spreadsheet content")
-        return SpreadsheetContentResponse(
-            content=result["content"],
-            error=None
-        )
-        
-    except Exception as e:
-        error_msg = f"Error in get_spreadsheet_content_tool: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return SpreadsheetContentResponse(content=None, error=error_msg)
+    logger.info(f"Getting content for spreadsheet: {request.spreadsheet_id}")
+    
+    # Use helper to get spreadsheet content
+    result = await asyncio.to_thread(
+        get_spreadsheet_content,
+        request.spreadsheet_id,
+        ranges=request.ranges
+    )
+    
+    if result["error"]:
+        raise ToolError(result["error"])
+    
+    logger.info(f"Successfully retrieved spreadsheet content")
+    return SpreadsheetContentResponse.model_construct(
+        content=result["content"],
+        error=None
+    )
 
-class UpdateSpreadsheetRequest(BaseModel):
+class UpdateSpreadsheetRequest(ToolRequest):
     spreadsheet_id: str
     requests: List[Dict[str, Any]]
 
-class UpdateSpreadsheetResponse(BaseModel):
+class UpdateSpreadsheetResponse(ToolResponse):
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 @mcp.tool()
+@drive_tool(UpdateSpreadsheetResponse, result=None)
 async def update_spreadsheet_content_tool(request: UpdateSpreadsheetRequest) -> UpdateSpreadsheetResponse:
     """
     Update the structure and formatting of a Google Sheets spreadsheet.
@@ -851,44 +1053,36 @@ async def update_spreadsheet_content_tool(request: UpdateSpreadsheetRequest) ->
     Returns:
         An object containing the update result and any error messages
     """
-    try:
-        logger.info(f"Updating content for spreadsheet: {request.spreadsheet_id}")
-        
-        # Use helper to update spreadsheet content
-        result = update_spreadsheet_content(
-            request.spreadsheet_id,
-            request.requests
-        )
-        
-        if result["error"]:
-            logger.error(result["error"])
-            return UpdateSpreadsheetResponse(
-                result=None,
-                error=result["error"]
-            )
-        
-        logger.info(f"Successfully updated spreadsheet content")
-        return UpdateSpreadsheetResponse(
-            result=result["result"],
-            error=None
-        )
-        
-    except Exception as e:
-        error_msg = f"Error in update_spreadsheet_content_tool: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return UpdateSpreadsheetResponse(result=None, error=error_msg)
+    logger.info(f"Updating content for spreadsheet: {request.spreadsheet_id}")
+    
+    # Use helper to update spreadsheet content
+    result = await asyncio.to_thread(
+        update_spreadsheet_content,
+        request.spreadsheet_id,
+        request.requests
+    )
+    
+    if result["error"]:
+        raise ToolError(result["error"])
+    
+    logger.info(f"Successfully updated spreadsheet content")
+    return UpdateSpreadsheetResponse.model_construct(
+        result=result["result"],
+        error=None
+    )
 
-class UpdateSpreadsheetValuesRequest(BaseModel):
+class UpdateSpreadsheetValuesRequest(ToolRequest):
     spreadsheet_id: str
     range: str
     values: List[List[Any]]
     input_option: Optional[str] = "USER_ENTERED"
 
-class UpdateSpreadsheetValuesResponse(BaseModel):
+class UpdateSpreadsheetValuesResponse(ToolResponse):
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 @mcp.tool()
+@drive_tool(UpdateSpreadsheetValuesResponse, result=None)
 async def update_spreadsheet_values_tool(request: UpdateSpreadsheetValuesRequest) -> UpdateSpreadsheetValuesResponse:
     """
     Update cell values in a Google Sheets spreadsheet.
@@ -906,47 +1100,38 @@ async def update_spreadsheet_values_tool(request: UpdateSpreadsheetValuesRequest
     Returns:
         An object containing the update result and any error messages
     """
-    try:
-        logger.info(f"Updating values in spreadsheet: {request.spreadsheet_id}, range: {request.range}")
-        
-        # Use helper to update spreadsheet values
-        result = update_spreadsheet_values(
-            request.spreadsheet_id,
-            request.range,
-            request.values,
-            request.input_option
-        )
-        
-        if result["error"]:
-            logger.error(result["error"])
-            return UpdateSpreadsheetValuesResponse(
-                result=None,
-                error=result["error"]
-            )
-        
-        logger.info(f"Successfully updated spreadsheet values")
-        return UpdateSpreadsheetValuesResponse(
-            result=result["result"],
-            error=None
-        )
-        
-    except Exception as e:
-        error_msg = f"Error in update_spreadsheet_values_tool: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return UpdateSpreadsheetValuesResponse(result=None, error=error_msg)
+    logger.info(f"Updating values in spreadsheet: {request.spreadsheet_id}, range: {request.range}")
+    
+    # Concurrent writes to the same spreadsheet are merged into one batchUpdate
+    result = await sheet_values_batcher.submit(
+        request.spreadsheet_id,
+        request.range,
+        request.values,
+        request.input_option
+    )
+    
+    if result["error"]:
+        raise ToolError(result["error"])
+    
+    logger.info(f"Successfully updated spreadsheet values")
+    return UpdateSpreadsheetValuesResponse.model_construct(
+        result=result["result"],
+        error=None
+    )
 
 # -------------------------------------------------------------------------
 # Presentation Content Tools
 # -------------------------------------------------------------------------
 
-class GetPresentationContentRequest(BaseModel):
+class GetPresentationContentRequest(ToolRequest):
     presentation_id: str
 
-class PresentationContentResponse(BaseModel):
+class PresentationContentResponse(ToolResponse):
     content: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 @mcp.tool()
+@drive_tool(PresentationContentResponse, content=None)
 async def get_presentation_content_tool(request: GetPresentationContentRequest) -> PresentationContentResponse:
     """
     Get the content of a Google Slides presentation.
@@ -960,39 +1145,30 @@ async def get_presentation_content_tool(request: GetPresentationContentRequest)
     Returns:
         An object containing the presentation content and any error messages
     """
-    try:
-        logger.info(f"Getting content for presentation: {request.presentation_id}")
-        
-        # Use helper to get presentation content
-        result = get_presentation_content(request.presentation_id)
-        
-        if result["error"]:
-            logger.error(result["error"])
-            return PresentationContentResponse(
-                content=None,
-                error=result["error"]
-            )
-        
-        logger.info(f"Successfully retrieved presentation content")
-        return PresentationContentResponse(
-            content=result["content"],
-            error=None
-        )
-        
-    except Exception as e:
-        error_msg = f"Error in get_presentation_content_tool: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return PresentationContentResponse(content=None, error=error_msg)
+    logger.info(f"Getting content for presentation: {request.presentation_id}")
+    
+    # Use helper to get presentation content
+    result = await asyncio.to_thread(get_presentation_content, request.presentation_id)
+    
+    if result["error"]:
+        raise ToolError(result["error"])
+    
+    logger.info(f"Successfully retrieved presentation content")
+    return PresentationContentResponse.model_construct(
+        content=result["content"],
+        error=None
+    )
 
-class UpdatePresentationRequest(BaseModel):
+class UpdatePresentationRequest(ToolRequest):
     presentation_id: str
     requests: List[Dict[str, Any]]
 
-class UpdatePresentationResponse(BaseModel):
+class UpdatePresentationResponse(ToolResponse):
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 @mcp.tool()
+@drive_tool(UpdatePresentationResponse, result=None)
 async def update_presentation_content_tool(request: UpdatePresentationRequest) -> UpdatePresentationResponse:
     """
     Update the content of a Google Slides presentation.
@@ -1012,47 +1188,39 @@ async def update_presentation_content_tool(request: UpdatePresentationRequest) -
     Returns:
         An object containing the update result and any error messages
     """
-    try:
-        logger.info(f"Updating content for presentation: {request.presentation_id}")
-        
-        # Use helper to update presentation content
-        result = update_presentation_content(
-            request.presentation_id,
-            request.requests
-        )
-        
-        if result["error"]:
-            logger.error(result["error"])
-            return UpdatePresentationResponse(
-                result=None,
-                error=result["error"]
-            )
-        
-        logger.info(f"Successfully updated presentation content")
-        return UpdatePresentationResponse(
-            result=result["result"],
-            error=None
-        )
-        
-    except Exception as e:
-        error_msg = f"Error in update_presentation_content_tool: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return UpdatePresentationResponse(result=None, error=error_msg)
+    logger.info(f"Updating content for presentation: {request.presentation_id}")
+    
+    # Use helper to update presentation content
+    result = await asyncio.to_thread(
+        update_presentation_content,
+        request.presentation_id,
+        request.requests
+    )
+    
+    if result["error"]:
+        raise ToolError(result["error"])
+    
+    logger.info(f"Successfully updated presentation content")
+    return UpdatePresentationResponse.model_construct(
+        result=result["result"],
+        error=None
+    )
 
 # -------------------------------------------------------------------------
 # File Management Tools (continued)
 # -------------------------------------------------------------------------
 
-class MoveFileRequest(BaseModel):
+class MoveFileRequest(ToolRequest):
     file_id: str
     destination_folder_id: str
     keep_previous_parents: Optional[bool] = False
 
-class MoveFileResponse(BaseModel):
+class MoveFileResponse(ToolResponse):
     file: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 @mcp.tool()
+@drive_tool(MoveFileResponse, file=None)
 async def move_drive_file(request: MoveFileRequest) -> MoveFileResponse:
     """
     Move a file to a different folder in Google Drive.
@@ -1069,40 +1237,36 @@ async def move_drive_file(request: MoveFileRequest) -> MoveFileResponse:
     Returns:
         An object containing the moved file metadata and any error messages
     """
-    try:
-        logger.info(f"Moving file {request.file_id} to folder {request.destination_folder_id}")
-        
-        # Use helper to move file
-        result = drive_helper.move_file(
-            file_id=request.file_id,
-            new_parent_id=request.destination_folder_id,
-            remove_parents=not request.keep_previous_parents
-        )
-        
-        if result["error"]:
-            logger.error(result["error"])
-            return MoveFileResponse(
-                file=None,
-                error=result["error"]
-            )
-        
-        logger.info(f"Successfully moved file to destination folder")
-        return MoveFileResponse(
-            file=result["file"],
-            error=None
-        )
-        
-    except Exception as e:
-        error_msg = f"Error in move_drive_file: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return MoveFileResponse(file=None, error=error_msg)
+    logger.info(f"Moving file {request.file_id} to folder {request.destination_folder_id}")
+    
+    # Use helper to move file
+    result = await asyncio.to_thread(
+        drive_helper.move_file,
+        file_id=request.file_id,
+        new_parent_id=request.destination_folder_id,
+        remove_parents=not request.keep_previous_parents
+    )
+    
+    if result["error"]:
+        raise ToolError(result["error"])
+    
+    logger.info(f"Successfully moved file to destination folder")
+    return MoveFileResponse.model_construct(
+        file=result["file"],
+        error=None
+    )
 
 # -------------------------------------------------------------------------
 # Server Setup
 # -------------------------------------------------------------------------
 
-def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlette:
+def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> 'Starlette':
     """Create a Starlette app with SSE transport for the MCP server."""
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.routing import Mount, Route
+    from mcp.server.sse import SseServerTransport
+    
     sse = SseServerTransport("/messages/")
 
     async def handle_sse(request: Request) -> None:
@@ -1127,6 +1291,7 @@ def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlett
 
 def main():
     import argparse
+    import uvicorn
 
     # Get MCP server instance from FastMCP
     mcp_server = mcp._mcp_server
@@ -1146,6 +1311,10 @@ def main():
         
         if auth_result["authenticated"]:
             logger.info(f"Authentication successful: {auth_result['message']}")
+            
+            # Build the Workspace API services in the background while the server starts;
+            # only once authenticated, so this never kicks off an OAuth flow of its own
+            threading.Thread(target=warm_up_services, name="gdrive-warmup", daemon=True).start()
         else:
             logger.error(f"Authentication failed: {auth_result['message']}")
             logger.error(f"Error details: {auth_result['error']}")
@@ -4,9 +4,10 @@ Jira MCP Agent Client - Simple client for analyzing Jira issues using react_agen
 """
 
 import os
+import json
 import asyncio
 import argparse
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -18,11 +19,38 @@ from langgraph.prebuilt import create_react_agent
 
 # LangChain imports
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, AIMessage
+from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
+
+# Agent steps allowed per analysis: one tool call plus the final answer,
+# with room for a retry
+AGENT_RECURSION_LIMIT = 10
+
+def _tool_error(messages: List[Any]) -> Optional[str]:
+    """Return the error reported by the last tool call in an agent run, if any.
+    
+    A tool that raised comes back with status "error"; the Jira tools report
+    failures in the "error" field of their JSON response instead.
+    """
+    tool_message = next((msg for msg in reversed(messages) if isinstance(msg, ToolMessage)), None)
+    if tool_message is None:
+        return None
+    if getattr(tool_message, "status", None) == "error":
+        return str(tool_message.content)
+    try:
+        payload = json.loads(tool_message.content)
+    except (TypeError, ValueError):
+        return None
+    return payload.get("error") if isinstance(payload, dict) else None
 
 class JiraIssueAnalyzer:
     """Simple agent for analyzing Jira issues using React Agent"""
     
+    # MCP client and agents shared by all analyzers, so repeated analyses
+    # reuse one SSE connection instead of re-handshaking with the server
+    _shared_client: Optional[MultiServerMCPClient] = None
+    _shared_agents: Dict[str, Any] = {}
+    _setup_lock = asyncio.Lock()
+    
     def __init__(self, model_name: str = "gpt-4o-mini"):
         """Initialize the Jira issue analyzer.
         
@@ -46,42 +74,53 @@ class JiraIssueAnalyzer:
         """
     
     async def setup(self):
-        """Set up the agent with the MCP tools."""
-        # Initialize the LLM
-        self.llm = ChatOpenAI(model=self.model_name, api_key=os.getenv("OPENAI_API_KEY"))
-        
-        # Get MCP server URL from environment
-        mcp_host = os.getenv("MCP_HOST", "127.0.0.1")
-        jira_mcp_port = os.getenv("JIRA_MCP_PORT", "3003")
-        mcp_url = f"http://{mcp_host}:{jira_mcp_port}/sse"
-        
-        try:
-            # Connect to the Jira MCP server
-            self.mcp_client = MultiServerMCPClient(
-                {
-                    "jiratools": {
-                        "url": mcp_url,
-                        "transport": "sse",
-                    }
-                }
-            )
+        """Set up the agent with the MCP tools, reusing the shared client and agent."""
+        cls = JiraIssueAnalyzer
+        async with cls._setup_lock:
+            if self.model_name in cls._shared_agents:
+                self.mcp_client = cls._shared_client
+                self.agent = cls._shared_agents[self.model_name]
+                return
             
-            await self.mcp_client.__aenter__()
+            # Initialize the LLM
+            self.llm = ChatOpenAI(model=self.model_name, api_key=os.getenv("OPENAI_API_KEY"))
             
-            # Get tools from the MCP server
-            mcp_tools = self.mcp_client.get_tools()
-            print(f"Loaded {len(mcp_tools)} tools from MCP servers")
+            # Get MCP server URL from environment
+            mcp_host = os.getenv("MCP_HOST", "127.0.0.1")
+            jira_mcp_port = os.getenv("JIRA_MCP_PORT", "3003")
+            mcp_url = f"http://{mcp_host}:{jira_mcp_port}/sse"
             
-            # Create a simple React agent
-            self.agent = create_react_agent(
-                self.llm,
-                mcp_tools,
-                prompt=self.system_prompt
-            )
-        except Exception as e:
-            print(f"Error connecting to MCP server: {str(e)}")
-            print(f"Make sure the Jira MCP server is running at {mcp_url}")
-            raise
+            try:
+                # Connect to the Jira MCP server once per process
+                if cls._shared_client is None:
+                    mcp_client = MultiServerMCPClient(
+                        {
+                            "jiratools": {
+                                "url": mcp_url,
+                                "transport": "sse",
+                            }
+                        }
+                    )
+                    
+                    await mcp_client.__aenter__()
+                    cls._shared_client = mcp_client
+                self.mcp_client = cls._shared_client
+                
+                # Get tools from the MCP server
+                mcp_tools = self.mcp_client.get_tools()
+                print(f"Loaded {len(mcp_tools)} tools from MCP servers")
+                
+                # Create a simple React agent
+                self.agent = create_react_agent(
+                    self.llm,
+                    mcp_tools,
+                    prompt=self.system_prompt
+                )
+                cls._shared_agents[self.model_name] = self.agent
+            except Exception as e:
+                print(f"Error connecting to MCP server: {str(e)}")
+                print(f"Make sure the Jira MCP server is running at {mcp_url}")
+                raise
     
     async def analyze_issue(self, issue_key: str) -> Dict[str, Any]:
         """Analyze a Jira issue.
@@ -98,32 +137,14 @@ class JiraIssueAnalyzer:
         try:
             print(f"Analyzing Jira issue: {issue_key}")
             
-            # Extract the issue first
-            extract_prompt = f"Please extract the summary and description from Jira issue {issue_key} using the JiraTools.extract_jira_issue tool."
-            
-            extract_result = await self.agent.ainvoke({
-                "messages": [
-                    HumanMessage(content=extract_prompt)
-                ]
-            })
-            
-            # Check if we got a response
-            ai_messages = [msg for msg in extract_result["messages"] if isinstance(msg, AIMessage)]
-            if not ai_messages:
-                return {
-                    "error": f"Could not extract information from issue {issue_key}"
-                }
-            
-            # Get the content from the AI's response
-            last_message = ai_messages[-1].content
-            
-            # Now analyze it
+            # Extract and analyze in one agent run: the agent calls the tool and
+            # continues straight into the assessment, without replaying the
+            # conversation in a second prompt
             analysis_prompt = f"""
-            Analyze this Jira issue and provide a simple assessment:
-            
-            {last_message}
+            Extract the summary and description of Jira issue {issue_key} using the
+            JiraTools.extract_jira_issue tool, then in the same response provide a
+            simple assessment of it:
             
-            Please include:
             1. Is this a well-formed user story?
             2. Quality score (1-5)
             3. 2-3 key recommendations for improvement
@@ -131,11 +152,28 @@ class JiraIssueAnalyzer:
             Keep your response concise.
             """
             
-            analysis_result = await self.agent.ainvoke({
-                "messages": extract_result["messages"] + [
-                    HumanMessage(content=analysis_prompt)
-                ]
-            })
+            analysis_result = await self.agent.ainvoke(
+                {
+                    "messages": [
+                        HumanMessage(content=analysis_prompt)
+                    ]
+                },
+                config={"recursion_limit": AGENT_RECURSION_LIMIT}
+            )
+            
+            # The run succeeded only if the extraction worked and it ended in a
+            # final answer rather than a pending tool call or an empty reply
+            messages = analysis_result["messages"]
+            tool_error = _tool_error(messages)
+            if tool_error:
+                return {
+                    "error": f"Could not extract information from issue {issue_key}: {tool_error}"
+                }
+            last = messages[-1] if messages else None
+            if not isinstance(last, AIMessage) or last.tool_calls or not last.content:
+                return {
+                    "error": f"No analysis was generated for issue {issue_key}"
+                }
             
             return analysis_result
         
@@ -144,17 +182,52 @@ class JiraIssueAnalyzer:
                 "error": f"Error analyzing issue: {str(e)}"
             }
     
+    async def analyze_issues(self, issue_keys: List[str], concurrency: int = 8) -> List[Dict[str, Any]]:
+        """Analyze several Jira issues concurrently over the shared MCP client.
+        
+        Args:
+            issue_keys: The Jira issue keys to analyze
+            concurrency: Maximum number of analyses in flight, to stay within LLM rate limits
+            
+        Returns:
+            Analysis results in the same order as issue_keys
+        """
+        # Connect before fanning out so the client is entered by this task
+        if not self.agent:
+            await self.setup()
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def analyze_one(issue_key: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.analyze_issue(issue_key)
+        
+        results = await asyncio.gather(*(analyze_one(key) for key in issue_keys), return_exceptions=True)
+        return [
+            {"error": f"Error analyzing issue: {str(result)}"} if isinstance(result, BaseException) else result
+            for result in results
+        ]
+    
     async def close(self):
-        """Clean up resources."""
-        if self.mcp_client:
-            await self.mcp_client.__aexit__(None, None, None)
+        """Release this analyzer's references; the shared client stays open."""
+        self.agent = None
+        self.mcp_client = None
+    
+    @classmethod
+    async def shutdown_all(cls):
+        """Close the shared MCP client used by all analyzers."""
+        cls._shared_agents.clear()
+        if cls._shared_client:
+            client, cls._shared_client = cls._shared_client, None
+            await client.__aexit__(None, None, None)
 
 
 async def main():
     """Run the Jira issue analyzer."""
     parser = argparse.ArgumentParser(description="Jira Issue Analyzer")
-    parser.add_argument("issue_key", help="Jira issue key (e.g., SCRUM-123)")
+    parser.add_argument("issue_keys", nargs="+", help="Jira issue keys (e.g., SCRUM-123)")
     parser.add_argument("--model", default="gpt-4o-mini", help="LLM model to use")
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum issues analyzed at once")
     args = parser.parse_args()
     
     # Check for OpenAI API key
@@ -166,25 +239,22 @@ async def main():
     analyzer = JiraIssueAnalyzer(model_name=args.model)
     
     try:
-        # Analyze the issue
-        result = await analyzer.analyze_issue(args.issue_key)
-        
-        if "error" in result:
-            print(f"Error: {result['error']}")
-            return
+        # Analyze the issues over one shared MCP connection
+        results = await analyzer.analyze_issues(args.issue_keys, concurrency=args.concurrency)
         
-        # Display the analysis result
-        ai_messages = [msg for msg in result["messages"] if isinstance(msg, AIMessage)]
-        if ai_messages:
-            print("\n===== JIRA ISSUE ANALYSIS =====")
-            print(ai_messages[-1].content)
-        else:
-            print("No analysis was generated")
+        for issue_key, result in zip(args.issue_keys, results):
+            if "error" in result:
+                print(f"Error ({issue_key}): {result['error']}")
+                continue
+            
+            # Display the analysis result, the run's final answer
+            print(f"\n===== JIRA ISSUE ANALYSIS: {issue_key} =====")
+            print(result["messages"][-1].content)
     
     finally:
         # Clean up
         await analyzer.close()
-
+        await JiraIssueAnalyzer.shutdown_all()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -4,34 +4,456 @@ Jira MCP Server - Provides Jira data extraction services via MCP protocol.
 """
 
 import os
+import re
 import sys
-from typing import Optional, Dict, Any
-from pydantic import BaseModel
+import logging
+import asyncio
+import contextlib
+import functools
+import importlib.util
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Tuple, Sequence, Callable, Awaitable
+from pydantic import BaseModel, ConfigDict
+import pydantic_core
 from mcp.server.fastmcp import FastMCP
+try:
+    # Private FastMCP helper; without it call_tool falls back to the stock conversion
+    from mcp.server.fastmcp.server import _convert_to_content
+except ImportError:
+    _convert_to_content = None
+from mcp.types import TextContent
 from mcp.server import Server
 from dotenv import load_dotenv
 from starlette.applications import Starlette
 from starlette.requests import Request
+from starlette.responses import PlainTextResponse
 from starlette.routing import Mount, Route
 from mcp.server.sse import SseServerTransport
 import uvicorn
-import requests
+import httpx
 
 # Load environment variables
 load_dotenv()
 
+# Module logger; messages use %-style arguments so they are only formatted
+# when the level is enabled
+logger = logging.getLogger("jira_mcp")
+
+class JiraMCP(FastMCP):
+    """FastMCP server that serializes pydantic tool responses in a single pass.
+    
+    FastMCP converts results with to_jsonable_python() followed by json.dumps();
+    pydantic_core.to_json() writes the JSON straight from the model instead.
+    """
+    
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Sequence[Any]:
+        if _convert_to_content is None:
+            return await super().call_tool(name, arguments)
+        result = await self._tool_manager.call_tool(name, arguments, context=self.get_context())
+        if isinstance(result, BaseModel):
+            return [TextContent(type="text", text=pydantic_core.to_json(result).decode("utf-8"))]
+        return _convert_to_content(result)
+
 # Create MCP server
-mcp = FastMCP("JiraTools")
+mcp = JiraMCP("JiraTools")
+
+# Shared async HTTP client, created on first use so concurrent tool calls
+# overlap their Jira round trips instead of blocking the event loop
+_jira_client: Optional[httpx.AsyncClient] = None
+_jira_client_lock = asyncio.Lock()
+
+# Connection pool and retry settings for Jira requests
+JIRA_POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+JIRA_TIMEOUT = httpx.Timeout(30.0, connect=3.05)
+JIRA_MAX_RETRIES = 3
+JIRA_BACKOFF_FACTOR = 0.3
+JIRA_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Multiplex concurrent requests over one connection with HTTP/2 when the
+# optional h2 package is installed (pip install httpx[http2])
+JIRA_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Largest Jira response body read into memory; bigger bodies are rejected
+# from their Content-Length before any of the body is downloaded
+JIRA_MAX_RESPONSE_BYTES = int(os.getenv("JIRA_MAX_RESPONSE_BYTES", str(10 * 1024 * 1024)))
+
+async def get_jira_client(jira_email: str, jira_api_token: str) -> httpx.AsyncClient:
+    """
+    Get the shared Jira HTTP client, creating it on first use.
+    
+    Args:
+        jira_email: Jira account email used for basic auth
+        jira_api_token: Jira API token used for basic auth
+        
+    Returns:
+        The shared httpx.AsyncClient
+    """
+    global _jira_client
+    if _jira_client is None:
+        async with _jira_client_lock:
+            if _jira_client is None:
+                _jira_client = httpx.AsyncClient(
+                    auth=(jira_email, jira_api_token),
+                    headers={"Accept": "application/json"},
+                    timeout=JIRA_TIMEOUT,
+                    limits=JIRA_POOL_LIMITS,
+                    # Retries failed connection attempts; status retries are in jira_request
+                    transport=httpx.AsyncHTTPTransport(
+                        retries=JIRA_MAX_RETRIES,
+                        limits=JIRA_POOL_LIMITS,
+                        http2=JIRA_HTTP2
+                    )
+                )
+    return _jira_client
+
+async def jira_request(client: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response:
+    """
+    Send a Jira request, retrying throttled and transient server errors with backoff.
+    
+    Args:
+        client: The shared Jira HTTP client
+        method: HTTP method
+        url: URL to request
+        **kwargs: Extra arguments passed to client.build_request
+        
+    Returns:
+        The last response received, with its body read
+        
+    Raises:
+        ValueError: If the response body is larger than JIRA_MAX_RESPONSE_BYTES
+    """
+    for attempt in range(JIRA_MAX_RETRIES + 1):
+        # Stream so the body is only downloaded once it is known to be wanted
+        response = await client.send(client.build_request(method, url, **kwargs), stream=True)
+        if response.status_code not in JIRA_RETRY_STATUSES or attempt == JIRA_MAX_RETRIES:
+            content_length = response.headers.get("Content-Length")
+            if content_length and content_length.isdigit() and int(content_length) > JIRA_MAX_RESPONSE_BYTES:
+                await response.aclose()
+                raise ValueError(f"Jira response too large: {content_length} bytes (limit {JIRA_MAX_RESPONSE_BYTES})")
+            # Count the decoded bytes as they arrive: chunked and compressed bodies
+            # carry no usable Content-Length, but must not be buffered unbounded
+            chunks = []
+            received = 0
+            try:
+                async for chunk in response.aiter_bytes():
+                    received += len(chunk)
+                    if received > JIRA_MAX_RESPONSE_BYTES:
+                        raise ValueError(f"Jira response too large: over {JIRA_MAX_RESPONSE_BYTES} bytes")
+                    chunks.append(chunk)
+            finally:
+                await response.aclose()
+            # Build a read response around the decoded body; the encoding and length
+            # headers described the wire body and would make httpx decode it again
+            headers = response.headers.copy()
+            headers.pop("Content-Encoding", None)
+            headers.pop("Content-Length", None)
+            return httpx.Response(
+                status_code=response.status_code,
+                headers=headers,
+                content=b"".join(chunks),
+                request=response.request
+            )
+        
+        # Drop the body of a response that is about to be retried unread
+        await response.aclose()
+        
+        # Honour Retry-After when Jira sends it, otherwise back off exponentially
+        retry_after = response.headers.get("Retry-After")
+        delay = float(retry_after) if retry_after and retry_after.isdigit() else JIRA_BACKOFF_FACTOR * (2 ** attempt)
+        await asyncio.sleep(delay)
+    return response
+
+async def close_jira_client() -> None:
+    """Close the shared Jira HTTP client if it was created."""
+    global _jira_client
+    if _jira_client is not None:
+        await _jira_client.aclose()
+        _jira_client = None
+
+# Recently extracted issues, keyed by issue key: (expires_at, etag, response).
+# Expired entries with an ETag are revalidated with If-None-Match.
+ISSUE_CACHE_TTL = 60
+ISSUE_CACHE_SIZE = 1024
+_issue_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+def _cache_issue(issue_key: str, etag: Optional[str], response: "JiraIssueResponse") -> None:
+    """Store an extracted issue, evicting the least recently used entries."""
+    _issue_cache[issue_key] = (time.monotonic() + ISSUE_CACHE_TTL, etag, response)
+    _issue_cache.move_to_end(issue_key)
+    while len(_issue_cache) > ISSUE_CACHE_SIZE:
+        _issue_cache.popitem(last=False)
+
+# Optional on-disk issue cache shared across restarts and server processes.
+# Off by default since it stores issue content; set JIRA_CACHE_DB to a file
+# path (outside the checkout, e.g. ~/.cache/jira_mcp/cache.db) to enable it.
+JIRA_CACHE_DB = os.path.expanduser(os.getenv("JIRA_CACHE_DB", ""))
+_db_local = threading.local()
+
+def _cache_db() -> Optional[sqlite3.Connection]:
+    """Get this thread's connection to the on-disk issue cache, opening it on first use."""
+    if not JIRA_CACHE_DB:
+        return None
+    conn = getattr(_db_local, "conn", None)
+    if conn is None:
+        os.makedirs(os.path.dirname(os.path.abspath(JIRA_CACHE_DB)), exist_ok=True)
+        conn = sqlite3.connect(JIRA_CACHE_DB, timeout=5)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS jira_cache ("
+            "key TEXT PRIMARY KEY, etag TEXT, summary TEXT, description TEXT, fetched_at REAL)"
+        )
+        _db_local.conn = conn
+    return conn
+
+def _disk_cache_get(issue_key: str) -> Optional[Tuple[Optional[str], str, str, float]]:
+    """
+    Look up an issue in the on-disk cache.
+    
+    Args:
+        issue_key: Jira issue key
+        
+    Returns:
+        Tuple of (etag, summary, description, fetched_at), or None if not cached
+    """
+    try:
+        conn = _cache_db()
+        if conn is None:
+            return None
+        return conn.execute(
+            "SELECT etag, summary, description, fetched_at FROM jira_cache WHERE key = ?",
+            (issue_key,)
+        ).fetchone()
+    except sqlite3.Error as e:
+        logger.warning("Could not read Jira cache: %s", e)
+        return None
+
+def _disk_cache_put(issue_key: str, etag: Optional[str], response: "JiraIssueResponse") -> None:
+    """
+    Store an extracted issue in the on-disk cache.
+    
+    Args:
+        issue_key: Jira issue key
+        etag: ETag of the Jira response, if any
+        response: The extracted issue
+    """
+    try:
+        conn = _cache_db()
+        if conn is None:
+            return
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO jira_cache (key, etag, summary, description, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (issue_key, etag, response.summary, response.description, time.time())
+            )
+    except sqlite3.Error as e:
+        logger.warning("Could not write Jira cache: %s", e)
 
-class JiraIssueRequest(BaseModel):
+@dataclass(frozen=True)
+class JiraCredentials:
+    """Jira connection settings read from the environment."""
+    base_url: Optional[str]
+    email: Optional[str]
+    api_token: Optional[str]
+    error: Optional[str] = None
+
+@functools.lru_cache(maxsize=None)
+def _jira_credentials() -> JiraCredentials:
+    """
+    Read the Jira credentials from environment variables once per process.
+    
+    Call _jira_credentials.cache_clear() to pick up changed variables.
+    
+    Returns:
+        The credentials, with an error message if any are missing
+    """
+    # Check for multiple possible environment variable names to be flexible
+    jira_base_url = os.getenv("JIRA_BASE_URL") or os.getenv("JIRA_INSTANCE_URL")
+    jira_email = os.getenv("JIRA_EMAIL") or os.getenv("JIRA_USERNAME")
+    jira_api_token = os.getenv("JIRA_API_TOKEN")
+    
+    # Log credential information for debugging (without revealing the token)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Using Jira credentials - URL: %s, User: %s", jira_base_url, jira_email)
+    
+    missing_vars = []
+    if not jira_base_url:
+        missing_vars.append("JIRA_BASE_URL/JIRA_INSTANCE_URL")
+    if not jira_email:
+        missing_vars.append("JIRA_EMAIL/JIRA_USERNAME")
+    if not jira_api_token:
+        missing_vars.append("JIRA_API_TOKEN")
+    
+    error_msg = None
+    if missing_vars:
+        error_msg = f"Jira credentials not found in environment variables: {', '.join(missing_vars)}"
+    return JiraCredentials(jira_base_url, jira_email, jira_api_token, error_msg)
+
+# ADF block nodes whose text is followed by a line break
+_ADF_BLOCK_TYPES = frozenset({"paragraph", "heading"})
+
+def _adf_to_text(description: Dict[str, Any]) -> str:
+    """
+    Extract the text of an Atlassian Document Format (ADF) description.
+    
+    Walks the whole tree, so text nested in lists, tables and panels is kept,
+    and ends every paragraph and heading with a newline.
+    
+    Args:
+        description: The ADF document
+        
+    Returns:
+        The plain text content
+    """
+    parts = []
+    append = parts.append
+    
+    # Recursive depth-first walk: CPython 3.11+ inlines Python-to-Python
+    # calls, which beats managing an explicit stack, and ADF nesting is
+    # only a few levels deep
+    def walk(node: Dict[str, Any]) -> None:
+        node_type = node.get("type")
+        if node_type == "text":
+            append(node.get("text", ""))
+            return
+        if node_type == "hardBreak":
+            append("\n")
+            return
+        
+        for child in node.get("content") or ():
+            walk(child)
+        if node_type in _ADF_BLOCK_TYPES:
+            append("\n")
+    
+    walk(description)
+    return "".join(parts)
+
+def _issue_to_response(issue_data: Dict[str, Any]) -> "JiraIssueResponse":
+    """Build a JiraIssueResponse from a Jira issue JSON object."""
+    fields = issue_data.get("fields") or {}
+    
+    # Plain-text descriptions (REST v2, Server/DC) are used as-is; only
+    # Atlassian Document Format (ADF) trees need walking
+    description = fields.get("description") or ""
+    if type(description) is dict:
+        description = _adf_to_text(description)
+    
+    # Both values are plain strings here, so skip re-validation
+    return JiraIssueResponse.model_construct(
+        summary=fields.get("summary") or "",
+        description=description,
+        error=None
+    )
+
+# Bodies larger than this are parsed in a worker thread so a big ADF tree
+# does not stall other tool calls on the event loop
+PARSE_IN_THREAD_BYTES = 256 * 1024
+
+def _parse_issue(content: bytes) -> "JiraIssueResponse":
+    """Parse a Jira issue response body into a JiraIssueResponse."""
+    return _issue_to_response(pydantic_core.from_json(content))
+
+def _parse_search(content: bytes) -> List[Tuple[str, "JiraIssueResponse"]]:
+    """Parse a Jira search response body into (issue key, response) pairs."""
+    return [
+        (issue_data.get("key"), _issue_to_response(issue_data))
+        for issue_data in pydantic_core.from_json(content).get("issues", [])
+    ]
+
+async def _parse_body(parse: Callable[[bytes], Any], content: bytes) -> Any:
+    """Run a response parser inline, or in a worker thread for large bodies."""
+    if len(content) > PARSE_IN_THREAD_BYTES:
+        return await asyncio.to_thread(parse, content)
+    return parse(content)
+
+class ToolRequest(BaseModel):
+    """Base for tool requests: immutable once validated; unknown fields are dropped."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+class ToolResponse(BaseModel):
+    """Base for tool responses: immutable, so cached responses can be shared safely,
+    and limited to the declared fields."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+class JiraIssueRequest(ToolRequest):
     issue_key: str
 
-class JiraIssueResponse(BaseModel):
+class JiraIssueResponse(ToolResponse):
     summary: str
     description: str
     error: Optional[str] = None
 
+class BatchJiraIssueRequest(ToolRequest):
+    issue_keys: List[str]
+
+class BatchJiraIssueResponse(ToolResponse):
+    issues: Dict[str, JiraIssueResponse]
+    error: Optional[str] = None
+
+# Issue fields requested from Jira; everything else (comments, worklogs,
+# custom fields...) is left out of the response
+ISSUE_FIELDS = ["summary", "description"]
+
+# Maximum number of issues fetched by one search request
+BATCH_SEARCH_LIMIT = 100
+
+# Shape of a Jira issue key; only keys matching it are interpolated into JQL
+ISSUE_KEY_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]+-\d+$")
+
+# Per-tool call counts and latency histograms, served at /metrics in the
+# Prometheus text format
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+_tool_calls: Dict[Tuple[str, str], int] = {}
+_tool_latency: Dict[str, List[float]] = {}
+
+def _timed(tool_name: str) -> Callable:
+    """Decorator recording the call count by status and the latency of a tool."""
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            status = "error"
+            try:
+                result = await func(*args, **kwargs)
+                if getattr(result, "error", None) is None:
+                    status = "ok"
+                return result
+            finally:
+                elapsed = time.perf_counter() - start
+                _tool_calls[(tool_name, status)] = _tool_calls.get((tool_name, status), 0) + 1
+                # Histogram as [bucket counts..., sum of seconds]
+                histogram = _tool_latency.setdefault(tool_name, [0] * len(LATENCY_BUCKETS) + [0.0])
+                for i, bound in enumerate(LATENCY_BUCKETS):
+                    if elapsed <= bound:
+                        histogram[i] += 1
+                histogram[-1] += elapsed
+        return wrapper
+    return decorator
+
+def render_metrics() -> str:
+    """Render the tool metrics in the Prometheus text exposition format."""
+    lines = [
+        "# TYPE mcp_tool_calls_total counter",
+    ]
+    for (tool_name, status), count in sorted(_tool_calls.items()):
+        lines.append(f'mcp_tool_calls_total{{tool="{tool_name}",status="{status}"}} {count}')
+    lines.append("# TYPE mcp_tool_latency_seconds histogram")
+    for tool_name, histogram in sorted(_tool_latency.items()):
+        for bound, count in zip(LATENCY_BUCKETS, histogram):
+            le = "+Inf" if bound == float("inf") else str(bound)
+            lines.append(f'mcp_tool_latency_seconds_bucket{{tool="{tool_name}",le="{le}"}} {count}')
+        lines.append(f'mcp_tool_latency_seconds_sum{{tool="{tool_name}"}} {histogram[-1]}')
+        lines.append(f'mcp_tool_latency_seconds_count{{tool="{tool_name}"}} {histogram[-2]}')
+    return "\n".join(lines) + "\n"
+
 @mcp.tool()
+@_timed("extract_jira_issue")
 async def extract_jira_issue(request: JiraIssueRequest) -> JiraIssueResponse:
     """
     Extract summary and description from a Jira issue using its key/ID.
@@ -42,89 +464,173 @@ async def extract_jira_issue(request: JiraIssueRequest) -> JiraIssueResponse:
     Returns:
         An object containing the summary, description and any error messages.
     """
+    # Serve recently extracted issues without a Jira round trip
+    cached = _issue_cache.get(request.issue_key)
+    if cached and cached[0] > time.monotonic():
+        _issue_cache.move_to_end(request.issue_key)
+        return cached[2]
+    
     try:
-        # Get Jira credentials from environment variables
-        # Check for multiple possible environment variable names to be flexible
-        jira_base_url = os.getenv("JIRA_BASE_URL") or os.getenv("JIRA_INSTANCE_URL")
-        jira_email = os.getenv("JIRA_EMAIL") or os.getenv("JIRA_USERNAME")
-        jira_api_token = os.getenv("JIRA_API_TOKEN")
-        
-        # Print credential information for debugging (without revealing the token)
-        print(f"Using Jira credentials - URL: {jira_base_url}, User: {jira_email}")
-        
-        if not jira_base_url or not jira_email or not jira_api_token:
-            missing_vars = []
-            if not jira_base_url:
-                missing_vars.append("JIRA_BASE_URL/JIRA_INSTANCE_URL")
-            if not jira_email:
-                missing_vars.append("JIRA_EMAIL/JIRA_USERNAME")
-            if not jira_api_token:
-                missing_vars.append("JIRA_API_TOKEN")
-            
-            error_msg = f"Jira credentials not found in environment variables: {', '.join(missing_vars)}"
-            print(f"ERROR: {error_msg}")
+        # Fall back to the on-disk cache, which other server processes share
+        if not cached:
+            row = await asyncio.to_thread(_disk_cache_get, request.issue_key)
+            if row:
+                etag, summary, description, fetched_at = row
+                remaining = fetched_at + ISSUE_CACHE_TTL - time.time()
+                cached = (time.monotonic() + remaining, etag, JiraIssueResponse(summary=summary, description=description))
+                if remaining > 0:
+                    _cache_issue(request.issue_key, etag, cached[2])
+                    return cached[2]
+        
+        creds = _jira_credentials()
+        if creds.error:
+            logger.error(creds.error)
             return JiraIssueResponse(
                 summary="",
                 description="",
-                error=error_msg
+                error=creds.error
             )
         
         # Construct the API URL
-        api_url = f"{jira_base_url}/rest/api/3/issue/{request.issue_key}"
-        print(f"Fetching Jira issue from: {api_url}")
+        api_url = f"{creds.base_url}/rest/api/3/issue/{request.issue_key}"
+        logger.debug("Fetching Jira issue from: %s", api_url)
         
         # Make the API request
-        response = requests.get(
-            api_url,
-            auth=(jira_email, jira_api_token),
-            headers={"Accept": "application/json"}
+        client = await get_jira_client(creds.email, creds.api_token)
+        headers = {"If-None-Match": cached[1]} if cached and cached[1] else None
+        response = await jira_request(
+            client, "GET", api_url,
+            params={"fields": ",".join(ISSUE_FIELDS)},
+            headers=headers
         )
         
+        # Unchanged since the cached copy expired
+        if response.status_code == 304 and cached:
+            _cache_issue(request.issue_key, cached[1], cached[2])
+            await asyncio.to_thread(_disk_cache_put, request.issue_key, cached[1], cached[2])
+            return cached[2]
+        
         # Check for errors
         if response.status_code != 200:
             error_msg = f"Failed to fetch Jira issue: {response.status_code} - {response.text}"
-            print(f"ERROR: {error_msg}")
+            logger.error(error_msg)
             return JiraIssueResponse(
                 summary="",
                 description="",
                 error=error_msg
             )
         
-        # Parse the JSON response
-        issue_data = response.json()
-        
-        # Extract the summary and description
-        summary = issue_data.get("fields", {}).get("summary", "")
-        description = issue_data.get("fields", {}).get("description", "")
-        
-        # If description is in Atlassian Document Format (ADF), extract the text content
-        if isinstance(description, dict) and "content" in description:
-            description_text = ""
-            for content in description.get("content", []):
-                if content.get("type") == "paragraph" and "content" in content:
-                    for text_content in content.get("content", []):
-                        if text_content.get("type") == "text":
-                            description_text += text_content.get("text", "")
-                    description_text += "\n"
-            description = description_text
-        
-        print(f"Successfully retrieved Jira issue {request.issue_key}")
-        return JiraIssueResponse(
-            summary=summary,
-            description=description
-        )
+        # Parse the JSON response with pydantic-core's Rust parser
+        result = await _parse_body(_parse_issue, response.content)
+        
+        logger.info("Successfully retrieved Jira issue %s", request.issue_key)
+        _cache_issue(request.issue_key, response.headers.get("ETag"), result)
+        await asyncio.to_thread(_disk_cache_put, request.issue_key, response.headers.get("ETag"), result)
+        return result
         
     except Exception as e:
         error_msg = f"Error extracting Jira issue: {str(e)}"
-        print(f"ERROR: {error_msg}")
-        import traceback
-        print(traceback.format_exc())
+        logger.exception(error_msg)
         return JiraIssueResponse(
             summary="",
             description="",
             error=error_msg
         )
 
+@mcp.tool()
+@_timed("batch_extract_jira_issues")
+async def batch_extract_jira_issues(request: BatchJiraIssueRequest) -> BatchJiraIssueResponse:
+    """
+    Extract summary and description from several Jira issues with one search per 100 keys.
+    
+    Args:
+        request: An object containing the Jira issue keys.
+        
+    Returns:
+        An object mapping each issue key to its summary, description and any error message.
+    """
+    try:
+        creds = _jira_credentials()
+        if creds.error:
+            logger.error(creds.error)
+            return BatchJiraIssueResponse(issues={}, error=creds.error)
+        
+        # Serve cached issues directly and search only for the rest
+        issues: Dict[str, JiraIssueResponse] = {}
+        now = time.monotonic()
+        pending = []
+        for issue_key in dict.fromkeys(request.issue_keys):
+            cached = _issue_cache.get(issue_key)
+            if cached and cached[0] > now:
+                issues[issue_key] = cached[2]
+            elif not ISSUE_KEY_PATTERN.match(issue_key.upper()):
+                issues[issue_key] = JiraIssueResponse(
+                    summary="",
+                    description="",
+                    error=f"Invalid Jira issue key: {issue_key!r}"
+                )
+            else:
+                pending.append(issue_key)
+        
+        client = await get_jira_client(creds.email, creds.api_token)
+        
+        async def fetch_each(keys: List[str]) -> None:
+            results = await asyncio.gather(*(extract_jira_issue(JiraIssueRequest(issue_key=key)) for key in keys))
+            issues.update(zip(keys, results))
+        
+        async def search(keys: List[str]) -> None:
+            # Keys were validated against ISSUE_KEY_PATTERN, so quoting cannot break the JQL
+            quoted = ",".join(f'"{key.upper()}"' for key in keys)
+            query = {
+                "jql": f"issueKey in ({quoted})",
+                "fields": ISSUE_FIELDS,
+                "maxResults": len(keys)
+            }
+            response = await jira_request(client, "POST", f"{creds.base_url}/rest/api/3/search/jql", json=query)
+            if response.status_code == 404:
+                # Jira Data Center has no /search/jql; use the legacy search there
+                response = await jira_request(client, "POST", f"{creds.base_url}/rest/api/3/search", json={
+                    **query,
+                    # Report unknown keys as warnings instead of failing the whole search
+                    "validateQuery": "warn"
+                })
+            if response.status_code == 400:
+                # The JQL names a key that doesn't exist (or isn't visible); fetch one by one
+                await fetch_each(keys)
+                return
+            if response.status_code != 200:
+                error_msg = f"Failed to search Jira issues: {response.status_code} - {response.text}"
+                logger.error(error_msg)
+                for key in keys:
+                    issues[key] = JiraIssueResponse(summary="", description="", error=error_msg)
+                return
+            
+            # Report results under the requested keys; Jira answers with canonical upper-case keys
+            requested = {key.upper(): key for key in keys}
+            for found_key, result in await _parse_body(_parse_search, response.content):
+                key = requested.get(found_key)
+                if key is not None:
+                    issues[key] = result
+                    _cache_issue(key, None, result)
+            
+            # A moved issue comes back under its new key, and unknown keys not at all;
+            # the issue endpoint follows old keys and reports the rest as not found
+            await fetch_each([key for key in keys if key not in issues])
+        
+        # Search the pending keys in chunks, concurrently
+        await asyncio.gather(*(
+            search(pending[i:i + BATCH_SEARCH_LIMIT])
+            for i in range(0, len(pending), BATCH_SEARCH_LIMIT)
+        ))
+        
+        logger.info("Successfully retrieved %d Jira issues", len(issues))
+        return BatchJiraIssueResponse(issues=issues)
+        
+    except Exception as e:
+        error_msg = f"Error extracting Jira issues: {str(e)}"
+        logger.exception(error_msg)
+        return BatchJiraIssueResponse(issues={}, error=error_msg)
+
 def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlette:
     """Create a Starlette app with SSE transport for the MCP server."""
     sse = SseServerTransport("/messages/")
@@ -141,37 +647,54 @@ def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlett
                 mcp_server.create_initialization_options(),
             )
 
+    async def handle_metrics(request: Request) -> PlainTextResponse:
+        return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Starlette):
+        # Close pooled Jira connections on shutdown
+        try:
+            yield
+        finally:
+            await close_jira_client()
+
     return Starlette(
         debug=debug,
         routes=[
             Route("/sse", endpoint=handle_sse),
+            Route("/metrics", endpoint=handle_metrics),
             Mount("/messages/", app=sse.handle_post_message),
         ],
+        lifespan=lifespan,
     )
 
 def main():
     import argparse
+    
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
 
     # Check Jira credentials at startup
-    jira_base_url = os.getenv("JIRA_BASE_URL") or os.getenv("JIRA_INSTANCE_URL")
-    jira_email = os.getenv("JIRA_EMAIL") or os.getenv("JIRA_USERNAME")
-    jira_api_token = os.getenv("JIRA_API_TOKEN")
+    creds = _jira_credentials()
     
-    print("\nJira MCP Server - Credential Check:")
-    if jira_base_url:
-        print(f"✓ JIRA_BASE_URL/INSTANCE_URL: {jira_base_url}")
+    logger.info("Jira MCP Server - Credential Check:")
+    if creds.base_url:
+        logger.info("✓ JIRA_BASE_URL/INSTANCE_URL: %s", creds.base_url)
     else:
-        print("✗ JIRA_BASE_URL/INSTANCE_URL: Not found in environment variables")
+        logger.warning("✗ JIRA_BASE_URL/INSTANCE_URL: Not found in environment variables")
         
-    if jira_email:
-        print(f"✓ JIRA_EMAIL/USERNAME: {jira_email}")
+    if creds.email:
+        logger.info("✓ JIRA_EMAIL/USERNAME: Present")
+        logger.debug("JIRA_EMAIL/USERNAME: %s", creds.email)
     else:
-        print("✗ JIRA_EMAIL/USERNAME: Not found in environment variables")
+        logger.warning("✗ JIRA_EMAIL/USERNAME: Not found in environment variables")
         
-    if jira_api_token:
-        print("✓ JIRA_API_TOKEN: Present (not showing for security)")
+    if creds.api_token:
+        logger.info("✓ JIRA_API_TOKEN: Present (not showing for security)")
     else:
-        print("✗ JIRA_API_TOKEN: Not found in environment variables")
+        logger.warning("✗ JIRA_API_TOKEN: Not found in environment variables")
     
     # Get MCP server instance from FastMCP
     mcp_server = mcp._mcp_server
@@ -182,9 +705,11 @@ def main():
     
     args = parser.parse_args()
     
-    print(f"\nStarting Jira MCP Server on {args.host}:{args.port}")
+    logger.info("Starting Jira MCP Server on %s:%s", args.host, args.port)
     
-    # Create Starlette app with SSE transport
+    # Create Starlette app with SSE transport. Each SSE session lives in this
+    # process, so scale out with separate processes on their own ports behind
+    # a session-affine proxy rather than uvicorn workers sharing one socket.
     starlette_app = create_starlette_app(mcp_server, debug=True)
     
     # Run the server with uvicorn
@@ -0,0 +1,5 @@
+"""
+MCP Common - Helpers shared by the agent clients of the MCP tools.
+"""
+
+__version__ = "0.1.0"
@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+"""
+Pooled HTTP client for the OpenAI calls made by the agent clients
+"""
+
+import importlib.util
+from typing import Optional
+
+import httpx
+
+# Keep-alive pool shared by every ChatOpenAI instance, so each agent turn
+# reuses a warm connection; HTTP/2 when the optional h2 package is installed
+_openai_http_client: Optional[httpx.AsyncClient] = None
+
+def get_openai_http_client() -> httpx.AsyncClient:
+    """Get the pooled async HTTP client used for OpenAI calls, creating it on first use."""
+    global _openai_http_client
+    if _openai_http_client is None or _openai_http_client.is_closed:
+        _openai_http_client = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60),
+            timeout=httpx.Timeout(60.0, connect=5.0)
+        )
+    return _openai_http_client
+
+async def close_openai_http_client():
+    """Close the pooled OpenAI HTTP client if it was created."""
+    global _openai_http_client
+    if _openai_http_client is not None:
+        client, _openai_http_client = _openai_http_client, None
+        await client.aclose()
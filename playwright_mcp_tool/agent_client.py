@@ -8,7 +8,9 @@ import asyncio
 import argparse
 import logging
 import logging.config
-from typing import Dict, Any
+import textwrap
+from contextlib import AsyncExitStack
+from typing import Dict, Any, Final, List, Optional, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -19,8 +21,8 @@ from config import (
     LOGGING_CONFIG,
     DEFAULT_MODEL,
     DEFAULT_MAX_RESULTS,
-    SYSTEM_PROMPTS,
     ERROR_MESSAGES,
+    MAX_HISTORY_MESSAGES,
     PLAYWRIGHT_MCP_URL
 )
 
@@ -30,14 +32,17 @@ from langgraph.prebuilt import create_react_agent
 
 # LangChain imports
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+from langchain_core.messages import HumanMessage, AIMessageChunk, SystemMessage, ToolMessage
+
+# Keep-alive pool for the OpenAI calls, shared with the other agent clients
+from mcp_common.openai_http import get_openai_http_client, close_openai_http_client
 
 # Configure logging
 logging.config.dictConfig(LOGGING_CONFIG)
 logger = logging.getLogger('playwright_mcp_agent')
 
 # Playwright Assistant Agent Prompt
-PLAYWRIGHT_AGENT_PROMPT = """
+PLAYWRIGHT_AGENT_PROMPT: Final[str] = """
 You are a helpful Playwright automation assistant with the following capabilities:
 
 1. BROWSER AUTOMATION:
@@ -115,6 +120,157 @@ Always respond in a clear, concise, and helpful manner. Ask for clarification if
 the user's request is ambiguous or lacks necessary details.
 """
 
+# System message built once and shared by every agent and invocation
+_PLAYWRIGHT_SYS: Final[SystemMessage] = SystemMessage(content=textwrap.dedent(PLAYWRIGHT_AGENT_PROMPT).strip())
+
+def trim_history(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Pre-model hook keeping the LLM input bounded on long automation runs.
+    
+    Sends the original query plus the last MAX_HISTORY_MESSAGES messages, so
+    tokens per step stop growing with the number of tool calls. The full
+    history stays in the graph state.
+    
+    Args:
+        state: Current agent graph state
+        
+    Returns:
+        State update with the messages to send to the LLM
+    """
+    messages = state["messages"]
+    if len(messages) <= MAX_HISTORY_MESSAGES + 1:
+        return {"llm_input_messages": messages}
+    
+    tail = messages[-MAX_HISTORY_MESSAGES:]
+    # Drop leading tool results whose tool call was trimmed away
+    while tail and isinstance(tail[0], ToolMessage):
+        tail = tail[1:]
+    return {"llm_input_messages": [messages[0]] + tail}
+
+class PlaywrightSession:
+    """Long-lived connection to the Playwright MCP server shared by every query.
+    
+    The SSE session, tool list and compiled agents are created once and reused,
+    so each query only pays for the agent run. A background task pings the
+    server; a failed ping marks the session stale and the next query reconnects.
+    """
+    
+    SERVER_NAME = "playwrighttools"
+    HEALTH_CHECK_INTERVAL = 30
+    
+    def __init__(self, url: str = PLAYWRIGHT_MCP_URL):
+        """Initialize the session without connecting.
+        
+        Args:
+            url: SSE URL of the Playwright MCP server
+        """
+        self.url = url
+        self._stack: Optional[AsyncExitStack] = None
+        self._client: Optional[MultiServerMCPClient] = None
+        self._tools: List[Any] = []
+        self._agents: Dict[Tuple[str, str], Any] = {}
+        self._lock = asyncio.Lock()
+        self._stale = False
+        self._health_task: Optional[asyncio.Task] = None
+    
+    async def get_agent(self, model_name: str = DEFAULT_MODEL):
+        """Get the agent for a model, connecting or reconnecting first if needed.
+        
+        Args:
+            model_name: LLM model to use
+            
+        Returns:
+            The compiled React agent
+        """
+        async with self._lock:
+            if self._stale:
+                logger.info("Reconnecting to the Playwright MCP server")
+                await self._disconnect()
+            if self._client is None:
+                await self._connect()
+            
+            key = (model_name, self.url)
+            agent = self._agents.get(key)
+            if agent is None:
+                # Initialize the LLM
+                llm = ChatOpenAI(
+                    model=model_name,
+                    api_key=os.getenv("OPENAI_API_KEY"),
+                    http_async_client=get_openai_http_client()
+                )
+                
+                # Create a React agent with tools and system prompt
+                agent = create_react_agent(
+                    llm,
+                    self._tools,
+                    prompt=_PLAYWRIGHT_SYS,
+                    pre_model_hook=trim_history
+                )
+                self._agents[key] = agent
+            return agent
+    
+    async def _connect(self):
+        """Open the SSE session and start the health check."""
+        stack = AsyncExitStack()
+        try:
+            self._client = await stack.enter_async_context(MultiServerMCPClient(
+                {
+                    self.SERVER_NAME: {
+                        "url": self.url,
+                        "transport": "sse",
+                    }
+                }
+            ))
+        except Exception:
+            await stack.aclose()
+            raise
+        self._stack = stack
+        self._stale = False
+        
+        # Get tools from the MCP server once per session
+        self._tools = self._client.get_tools()
+        logger.info("Loaded %d tools from MCP servers", len(self._tools))
+        
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.create_task(self._health_check())
+    
+    async def _disconnect(self):
+        """Close the SSE session; agents bound to its tools are dropped too."""
+        self._agents.clear()
+        self._tools = []
+        self._client = None
+        if self._stack:
+            stack, self._stack = self._stack, None
+            try:
+                await stack.aclose()
+            except Exception as e:
+                logger.warning("Error closing MCP session: %s", e)
+    
+    async def _health_check(self):
+        """Ping the server periodically so a dropped session is noticed between queries."""
+        while True:
+            await asyncio.sleep(self.HEALTH_CHECK_INTERVAL)
+            client = self._client
+            if client is None or self._stale:
+                continue
+            try:
+                await client.sessions[self.SERVER_NAME].send_ping()
+            except Exception as e:
+                # The session was opened by the caller's task, so it is
+                # closed and reopened there on the next query
+                logger.warning("Playwright MCP server ping failed: %s", e)
+                self._stale = True
+    
+    async def close(self):
+        """Stop the health check and close the session."""
+        if self._health_task:
+            self._health_task.cancel()
+            self._health_task = None
+        async with self._lock:
+            await self._disconnect()
+
+# Shared by every query in this process
+playwright_session = PlaywrightSession()
+
 async def run_playwright_agent(query: str, model_name: str = DEFAULT_MODEL) -> None:
     """
     Run the Playwright Agent with the provided query
@@ -129,60 +285,34 @@ async def run_playwright_agent(query: str, model_name: str = DEFAULT_MODEL) -> N
         return
     
     try:
-        # Initialize the LLM
-        llm = ChatOpenAI(model=model_name, api_key=os.getenv("OPENAI_API_KEY"))
+        # Reuse the open MCP session and compiled agent
+        agent = await playwright_session.get_agent(model_name)
         
-        # Connect to the Playwright MCP server
-        mcp_client = MultiServerMCPClient(
+        # Run the agent, printing the answer as it streams in
+        logger.info("Processing query: %s", query)
+        print("\n===== PLAYWRIGHT ASSISTANT RESPONSE =====")
+        generated = False
+        async for chunk, metadata in agent.astream(
             {
-                "playwrighttools": {
-                    "url": PLAYWRIGHT_MCP_URL,
-                    "transport": "sse",
-                }
-            }
-        )
-        
-        await mcp_client.__aenter__()
-        
-        try:
-            # Get tools from the MCP server
-            mcp_tools = mcp_client.get_tools()
-            logger.info(f"Loaded {len(mcp_tools)} tools from MCP servers")
-            
-            # Create a React agent with tools and system prompt
-            agent = create_react_agent(
-                llm,
-                mcp_tools,
-                prompt=PLAYWRIGHT_AGENT_PROMPT
-            )
-            
-            # Create the user query
-            user_message = f"""
-            {query}
-            """
-            
-            # Run the agent
-            logger.info(f"Processing query: {query}")
-            result = await agent.ainvoke({
                 "messages": [
-                    HumanMessage(content=user_message)
+                    HumanMessage(content=query.strip())
                 ]
-            })
-            
-            # Display the response
-            ai_messages = [msg for msg in result["messages"] if isinstance(msg, AIMessage)]
-            if ai_messages:
-                print("\n===== PLAYWRIGHT ASSISTANT RESPONSE =====")
-                print(ai_messages[-1].content)
-            else:
-                print("No response was generated")
-                
-        finally:
-            # Clean up
-            await mcp_client.__aexit__(None, None, None)
+            },
+            stream_mode="messages"
+        ):
+            # Only LLM tokens; tool results stream from the "tools" node
+            if isinstance(chunk, AIMessageChunk) and chunk.content and metadata.get("langgraph_node") == "agent":
+                print(chunk.content, end="", flush=True)
+                generated = True
+        
+        # Finish the streamed line
+        if generated:
+            print()
+        else:
+            print("No response was generated")
             
     except Exception as e:
-        logger.error(f"Error running Playwright agent: {str(e)}")
+        logger.error("Error running Playwright agent: %s", e)
         print(f"Error: {str(e)}")
 
 async def main():
@@ -193,45 +323,55 @@ async def main():
     parser.add_argument("--model", default=DEFAULT_MODEL, help="OpenAI model to use")
     args = parser.parse_args()
     
-    if args.interactive:
-        print("\n===== Playwright Automation Assistant =====")
-        print("Ask questions or give commands for browser automation tasks.")
-        print("Examples:")
-        print(" - \"Open Chrome and go to Google\"")
-        print(" - \"Navigate to github.com and search for 'playwright'\"")
-        print(" - \"Fill the login form with username 'test' and password 'pass123'\"")
-        print(" - \"Click the 'Submit' button\"")
-        print(" - \"Take a screenshot of the current page\"")
-        print(" - \"Extract text from the main heading\"")
-        print(" - \"Get data from the products table\"")
-        print(" - \"Check if the error message is visible\"")
-        print("Type 'exit' or 'quit' to end the session.")
-        
-        while True:
-            # Get query from user
-            query = input("\nWhat would you like to automate? ")
-            
-            # Check for exit command
-            if query.lower() in ['exit', 'quit']:
-                print("Goodbye!")
-                break
+    try:
+        if args.interactive:
+            print("\n===== Playwright Automation Assistant =====")
+            print("Ask questions or give commands for browser automation tasks.")
+            print("Examples:")
+            print(" - \"Open Chrome and go to Google\"")
+            print(" - \"Navigate to github.com and search for 'playwright'\"")
+            print(" - \"Fill the login form with username 'test' and password 'pass123'\"")
+            print(" - \"Click the 'Submit' button\"")
+            print(" - \"Take a screenshot of the current page\"")
+            print(" - \"Extract text from the main heading\"")
+            print(" - \"Get data from the products table\"")
+            print(" - \"Check if the error message is visible\"")
+            print("Type 'exit' or 'quit' to end the session.")
             
-            # Skip empty queries
-            if not query.strip():
-                continue
+            while True:
+                # Get query from user in a thread, so the session health check
+                # keeps running while the user types
+                try:
+                    query = await asyncio.to_thread(input, "\nWhat would you like to automate? ")
+                except EOFError:
+                    print("\nGoodbye!")
+                    break
+                
+                # Check for exit command
+                if query.lower() in ['exit', 'quit']:
+                    print("Goodbye!")
+                    break
                 
-            # Process the query
-            await run_playwright_agent(query, args.model)
-    elif args.query:
-        await run_playwright_agent(args.query, args.model)
-    else:
-        print("Please provide a query or use --interactive mode")
-        print("Example: python agent_client.py \"Open Chrome and go to Google\"")
-        print("Example: python agent_client.py \"Navigate to github.com and search for playwright\"")
-        print("Example: python agent_client.py \"Fill the login form and click submit\"")
-        print("Example: python agent_client.py \"Extract product information from amazon.com\"")
-        print("Example: python agent_client.py \"Take a screenshot of the news section on cnn.com\"")
-        print("Example: python agent_client.py -i")
+                # Skip empty queries
+                if not query.strip():
+                    continue
+                    
+                # Process the query
+                await run_playwright_agent(query, args.model)
+        elif args.query:
+            await run_playwright_agent(args.query, args.model)
+        else:
+            print("Please provide a query or use --interactive mode")
+            print("Example: python agent_client.py \"Open Chrome and go to Google\"")
+            print("Example: python agent_client.py \"Navigate to github.com and search for playwright\"")
+            print("Example: python agent_client.py \"Fill the login form and click submit\"")
+            print("Example: python agent_client.py \"Extract product information from amazon.com\"")
+            print("Example: python agent_client.py \"Take a screenshot of the news section on cnn.com\"")
+            print("Example: python agent_client.py -i")
+    finally:
+        # Close the shared MCP session and OpenAI connections
+        await playwright_session.close()
+        await close_openai_http_client()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -21,8 +21,11 @@ PLAYWRIGHT_MCP_URL = f"http://{MCP_HOST}:{PLAYWRIGHT_MCP_PORT}/sse"
 # Agent settings
 DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", "gpt-4o-mini")
 DEFAULT_MAX_RESULTS = int(os.getenv("DEFAULT_MAX_RESULTS", "5"))
+# Most recent messages sent to the LLM on each agent step (besides the query)
+MAX_HISTORY_MESSAGES = int(os.getenv("MAX_HISTORY_MESSAGES", "12"))
 
-# Logging configuration
+# Logging configuration (set LOG_LEVEL=DEBUG for verbose output)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING").upper()
 LOGGING_CONFIG = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -35,40 +38,24 @@ LOGGING_CONFIG = {
         'console': {
             'class': 'logging.StreamHandler',
             'formatter': 'standard',
-            'level': 'DEBUG',
+            'level': LOG_LEVEL,
             'stream': 'ext://sys.stdout'
         },
     },
     'loggers': {
         'playwright_mcp_server': {
             'handlers': ['console'],
-            'level': 'DEBUG',
+            'level': LOG_LEVEL,
             'propagate': True
         },
         'playwright_mcp_agent': {
             'handlers': ['console'],
-            'level': 'DEBUG',
+            'level': LOG_LEVEL,
             'propagate': True
         }
     }
 }
 
-# System prompts
-SYSTEM_PROMPTS = {
-    'playwright_agent': """
-    You are a helpful Playwright automation assistant. Your job is to automate browser tasks.
-    Focus on these key capabilities:
-    
-    1. Browser control (launch, navigate, screenshot, close)
-    2. Page interactions (click, fill, select, check, press)
-    3. Page analysis (get text, attributes, count elements, check visibility)
-    4. Data extraction (tables, page title, URL, content)
-    5. Advanced interactions (hover, drag and drop, file upload, JavaScript execution)
-    
-    Provide a concise response after performing automation tasks.
-    """
-}
-
 # Error messages
 ERROR_MESSAGES = {
     'missing_api_key': "ERROR: OPENAI_API_KEY not found in environment variables",
@@ -0,0 +1,105 @@
+"""
+Tests for the Google Drive helper functions
+"""
+
+import asyncio
+import os
+from unittest import mock
+
+import pytest
+
+os.environ.setdefault('SKIP_DOTENV', '1')
+pytest.importorskip('googleapiclient')
+
+from google_drive_mcp_tool import drive_helper as dh
+
+
+@pytest.fixture
+def sheets(monkeypatch):
+    """Fake Sheets 'spreadsheets' resource wired into the default helper."""
+    service = mock.MagicMock()
+    service.files.return_value.get.return_value.execute.return_value = {'modifiedTime': 't0'}
+    spreadsheets = mock.MagicMock()
+    monkeypatch.setattr(dh.drive_helper, '_service', service)
+    monkeypatch.setitem(dh.drive_helper._workspace_services, ('sheets', 'v4', 'spreadsheets'), spreadsheets)
+    monkeypatch.setattr(dh, '_CONTENT_CACHE', dh.OrderedDict())
+    return spreadsheets
+
+
+def _sheet(title, *rows):
+    return {
+        'properties': {'title': title},
+        'data': [{'rowData': [{'values': [{'formattedValue': value} for value in row]} for row in rows]}]
+    }
+
+
+def test_get_spreadsheet_content_accepts_two_whole_sheets(sheets):
+    sheets.get.return_value.execute.return_value = {
+        'properties': {'title': 'Book'},
+        'sheets': [_sheet('Sheet1', ['a']), _sheet('Sheet2', ['b'])]
+    }
+
+    result = dh.get_spreadsheet_content('sheet-id', ranges=['Sheet1', 'Sheet2'])
+
+    assert result['error'] is None
+    assert result['content']['sheets'] == {'Sheet1': [['a']], 'Sheet2': [['b']]}
+    assert sheets.get.call_args.kwargs['ranges'] == ['Sheet1', 'Sheet2']
+
+
+def test_get_spreadsheet_content_rejects_two_ranges_on_one_sheet(sheets):
+    sheet = _sheet('Sheet1', ['a'])
+    sheet['data'].append({'rowData': [{'values': [{'formattedValue': 'b'}]}]})
+    sheets.get.return_value.execute.return_value = {'properties': {'title': 'Book'}, 'sheets': [sheet]}
+
+    result = dh.get_spreadsheet_content('sheet-id', ranges=['Sheet1!A1', 'Sheet1!B1'])
+
+    assert result['content'] is None
+    assert 'at most one range per sheet' in result['error']
+
+
+def test_sheet_values_coalescer_shares_batch_error_without_retrying(monkeypatch):
+    batch = mock.Mock(return_value={'result': None, 'error': 'Error updating spreadsheet values: 429'})
+    single = mock.Mock()
+    monkeypatch.setattr(dh, '_update_coalesced_values', batch)
+    monkeypatch.setattr(dh, 'update_spreadsheet_values', single)
+    coalescer = dh.SheetValuesCoalescer(window=0.01)
+
+    async def write_two():
+        return await asyncio.gather(
+            coalescer.submit('sheet-id', 'Sheet1!A1', [[1]]),
+            coalescer.submit('sheet-id', 'Sheet1!B1', [[2]])
+        )
+
+    results = asyncio.run(write_two())
+
+    assert [result['error'] for result in results] == [batch.return_value['error']] * 2
+    batch.assert_called_once()
+    single.assert_not_called()
+
+
+def test_sheet_values_coalescer_retries_ranges_after_invalid_range(monkeypatch):
+    monkeypatch.setattr(dh, '_update_coalesced_values', mock.Mock(return_value={'result': None, 'error': None}))
+    monkeypatch.setattr(dh, 'update_spreadsheet_values', mock.Mock(
+        side_effect=lambda sheet_id, range_name, values, option: {'result': range_name, 'error': None}
+    ))
+    coalescer = dh.SheetValuesCoalescer(window=0.01)
+
+    async def write_two():
+        return await asyncio.gather(
+            coalescer.submit('sheet-id', 'Sheet1!A1', [[1]]),
+            coalescer.submit('sheet-id', 'Bad!!B1', [[2]])
+        )
+
+    assert [result['result'] for result in asyncio.run(write_two())] == ['Sheet1!A1', 'Bad!!B1']
+
+
+@pytest.mark.parametrize('timeout, expected', [(None, dh.AuthorizedSessionHttp.TIMEOUT), ((3, 30), (3, 30))])
+def test_authorized_session_http_passes_timeout(timeout, expected):
+    transport = dh.AuthorizedSessionHttp(mock.Mock(valid=True), timeout=timeout)
+    transport.session = mock.Mock()
+    transport.session.request.return_value = mock.Mock(status_code=200, headers={}, content=b'{}')
+
+    response, content = transport.request('https://www.googleapis.com/drive/v3/files')
+
+    assert response.status == 200
+    assert transport.session.request.call_args.kwargs['timeout'] == expected
@@ -0,0 +1,73 @@
+"""
+Tests for the Google Drive MCP server's shared tool scaffolding
+"""
+
+import asyncio
+import importlib.util
+import os
+import sys
+from typing import Dict, Optional, Any
+
+import pytest
+
+os.environ.setdefault('SKIP_DOTENV', '1')
+pytest.importorskip('mcp')
+pytest.importorskip('googleapiclient')
+
+# The server imports its helper and config modules by their bare names, and
+# shares its name with the package, so load it from its file
+_SERVER_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'google_drive_mcp_tool')
+sys.path.insert(0, _SERVER_DIR)
+_spec = importlib.util.spec_from_file_location(
+    'gdrive_mcp_server', os.path.join(_SERVER_DIR, 'google_drive_mcp_tool.py')
+)
+server = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(server)
+
+
+class FolderRequest(server.ToolRequest):
+    name: str
+    idempotency_key: Optional[str] = None
+
+
+class FolderResponse(server.ToolResponse):
+    folder: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+@pytest.fixture
+def create_folder(monkeypatch):
+    monkeypatch.setattr(server, '_IDEMPOTENT_CALLS', server.OrderedDict())
+    calls = []
+
+    @server.drive_tool(FolderResponse, folder=None)
+    async def create_folder(request: FolderRequest) -> FolderResponse:
+        calls.append(request.name)
+        return FolderResponse(folder={'name': request.name})
+
+    create_folder.calls = calls
+    return create_folder
+
+
+def test_idempotency_key_replays_the_first_response(create_folder):
+    async def create_twice():
+        first = await create_folder(FolderRequest(name='Reports', idempotency_key='k1'))
+        second = await create_folder(FolderRequest(name='Reports', idempotency_key='k1'))
+        return first, second
+
+    first, second = asyncio.run(create_twice())
+
+    assert first == second
+    assert create_folder.calls == ['Reports']
+
+
+def test_idempotency_key_reused_with_different_parameters_is_rejected(create_folder):
+    async def create_twice():
+        await create_folder(FolderRequest(name='Reports', idempotency_key='k1'))
+        return await create_folder(FolderRequest(name='Invoices', idempotency_key='k1'))
+
+    response = asyncio.run(create_twice())
+
+    assert response.folder is None
+    assert 'reused with different parameters' in response.error
+    assert create_folder.calls == ['Reports']
@@ -0,0 +1,42 @@
+"""
+Tests for the video MCP server helpers
+"""
+
+import base64
+import io
+import os
+
+import pytest
+
+pytest.importorskip('mcp')
+pytest.importorskip('openai')
+
+from video_mcp_tool import video_mcp_server as vs
+
+
+def test_write_base64_to_file_decodes_line_wrapped_input():
+    data = os.urandom(vs.BASE64_DECODE_CHUNK)
+    # 76-character lines, as written by MIME encoders and the base64 CLI
+    encoded = base64.encodebytes(data).decode()
+    assert len(encoded) > vs.BASE64_DECODE_CHUNK
+
+    output = io.BytesIO()
+    vs.write_base64_to_file(encoded, output)
+
+    assert output.getvalue() == data
+
+
+def test_write_base64_to_file_rejects_truncated_input():
+    with pytest.raises(ValueError):
+        vs.write_base64_to_file(base64.b64encode(b'video').decode()[:-1], io.BytesIO())
+
+
+def test_chunk_transcripts_groups_segments_by_token_budget():
+    # About 150 words per minute of speech, one transcript per 60-second segment
+    segment = " ".join(["word"] * 150)
+
+    chunks = vs.chunk_transcripts([segment] * 120 + [" "], max_tokens=2000)
+
+    assert len(chunks) == 12
+    assert all(len(chunk) <= 2000 * vs.CHARS_PER_TOKEN for chunk in chunks)
+    assert " ".join(chunks) == " ".join([segment] * 120)
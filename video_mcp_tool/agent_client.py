@@ -6,7 +6,7 @@ Video MCP Agent Client - Simple client for processing videos using react_agent
 import os
 import asyncio
 import argparse
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -18,11 +18,36 @@ from langgraph.prebuilt import create_react_agent
 
 # LangChain imports
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, AIMessage
+from langchain_core.messages import HumanMessage, AIMessageChunk
+
+# Keep-alive pool for the OpenAI calls, shared with the other agent clients
+from mcp_common.openai_http import get_openai_http_client, close_openai_http_client
 
 class VideoProcessor:
     """Simple agent for processing videos using React Agent"""
     
+    # MCP client and agents shared by all processors, so repeated requests
+    # reuse one SSE connection instead of re-handshaking with the server
+    _shared_client: Optional[MultiServerMCPClient] = None
+    _shared_agents: Dict[str, Any] = {}
+    _setup_lock = asyncio.Lock()
+    _instances: Dict[str, "VideoProcessor"] = {}
+    
+    @classmethod
+    def shared(cls, model_name: str = "gpt-4o-mini") -> "VideoProcessor":
+        """Get the process-wide processor for a model, creating it on first use.
+        
+        Args:
+            model_name: The name of the LLM model to use
+            
+        Returns:
+            The shared VideoProcessor, with its agent kept set up between requests
+        """
+        processor = cls._instances.get(model_name)
+        if processor is None:
+            processor = cls._instances[model_name] = cls(model_name=model_name)
+        return processor
+    
     def __init__(self, model_name: str = "gpt-4o-mini"):
         """Initialize the video processor.
         
@@ -50,48 +75,65 @@ class VideoProcessor:
         """
     
     async def setup(self):
-        """Set up the agent with the MCP tools."""
-        # Initialize the LLM
-        self.llm = ChatOpenAI(model=self.model_name, api_key=os.getenv("OPENAI_API_KEY"))
-        
-        # Get MCP server URL from environment
-        mcp_host = os.getenv("MCP_HOST", "127.0.0.1")
-        video_mcp_port = os.getenv("VIDEO_MCP_PORT", "3004")
-        mcp_url = f"http://{mcp_host}:{video_mcp_port}/sse"
-        
-        try:
-            # Connect to the Video MCP server
-            self.mcp_client = MultiServerMCPClient(
-                {
-                    "videotools": {
-                        "url": mcp_url,
-                        "transport": "sse",
-                    }
-                }
-            )
+        """Set up the agent with the MCP tools, reusing the shared client and agent."""
+        cls = VideoProcessor
+        async with cls._setup_lock:
+            if self.model_name in cls._shared_agents:
+                self.mcp_client = cls._shared_client
+                self.agent = cls._shared_agents[self.model_name]
+                return
             
-            await self.mcp_client.__aenter__()
+            # Initialize the LLM
+            self.llm = ChatOpenAI(
+                model=self.model_name,
+                api_key=os.getenv("OPENAI_API_KEY"),
+                http_async_client=get_openai_http_client()
+            )
             
-            # Get tools from the MCP server
-            mcp_tools = self.mcp_client.get_tools()
-            print(f"Loaded {len(mcp_tools)} tools from MCP servers")
+            # Get MCP server URL from environment
+            mcp_host = os.getenv("MCP_HOST", "127.0.0.1")
+            video_mcp_port = os.getenv("VIDEO_MCP_PORT", "3004")
+            mcp_url = f"http://{mcp_host}:{video_mcp_port}/sse"
             
-            # Create a simple React agent
-            self.agent = create_react_agent(
-                self.llm,
-                mcp_tools,
-                prompt=self.system_prompt
-            )
-        except Exception as e:
-            print(f"Error connecting to MCP server: {str(e)}")
-            print(f"Make sure the Video MCP server is running at {mcp_url}")
-            raise
+            try:
+                # Connect to the Video MCP server once per process
+                if cls._shared_client is None:
+                    mcp_client = MultiServerMCPClient(
+                        {
+                            "videotools": {
+                                "url": mcp_url,
+                                "transport": "sse",
+                            }
+                        }
+                    )
+                    
+                    await mcp_client.__aenter__()
+                    cls._shared_client = mcp_client
+                self.mcp_client = cls._shared_client
+                
+                # Get tools from the MCP server
+                mcp_tools = self.mcp_client.get_tools()
+                print(f"Loaded {len(mcp_tools)} tools from MCP servers")
+                
+                # Create a simple React agent
+                self.agent = create_react_agent(
+                    self.llm,
+                    mcp_tools,
+                    prompt=self.system_prompt
+                )
+                cls._shared_agents[self.model_name] = self.agent
+            except Exception as e:
+                print(f"Error connecting to MCP server: {str(e)}")
+                print(f"Make sure the Video MCP server is running at {mcp_url}")
+                raise
     
-    async def process_request(self, request: str, **kwargs) -> Dict[str, Any]:
+    async def process_request(self, request: str, on_token: Optional[Callable[[str], None]] = None,
+                              **kwargs) -> Dict[str, Any]:
         """Process a video request.
         
         Args:
             request: The user's request describing what they want to do with the video
+            on_token: Optional callback receiving the agent's answer as it streams in
             **kwargs: Additional parameters like language, model, etc.
             
         Returns:
@@ -114,12 +156,23 @@ class VideoProcessor:
             else:
                 prompt = request
             
-            # Let the agent decide what to do
-            result = await self.agent.ainvoke({
-                "messages": [
-                    HumanMessage(content=prompt)
-                ]
-            })
+            # Let the agent decide what to do, streaming its tokens to on_token
+            result = {"messages": []}
+            async for mode, data in self.agent.astream(
+                {
+                    "messages": [
+                        HumanMessage(content=prompt)
+                    ]
+                },
+                stream_mode=["messages", "values"]
+            ):
+                if mode == "values":
+                    # Latest full state; the last one is the final result
+                    result = data
+                elif on_token:
+                    chunk, metadata = data
+                    if isinstance(chunk, AIMessageChunk) and chunk.content and metadata.get("langgraph_node") == "agent":
+                        on_token(chunk.content)
             
             return result
         
@@ -129,9 +182,19 @@ class VideoProcessor:
             }
     
     async def close(self):
-        """Clean up resources."""
-        if self.mcp_client:
-            await self.mcp_client.__aexit__(None, None, None)
+        """Release this processor's references; the shared client stays open."""
+        self.agent = None
+        self.mcp_client = None
+    
+    @classmethod
+    async def shutdown_all(cls):
+        """Close the shared MCP client used by all processors."""
+        cls._shared_agents.clear()
+        cls._instances.clear()
+        if cls._shared_client:
+            client, cls._shared_client = cls._shared_client, None
+            await client.__aexit__(None, None, None)
+        await close_openai_http_client()
 
 
 async def main():
@@ -151,12 +214,21 @@ async def main():
         print("Please set it in your .env file")
         return
     
-    processor = VideoProcessor(model_name=args.model)
+    processor = VideoProcessor.shared(args.model)
     
     try:
-        # Process the request
+        # Process the request, printing the answer as it streams in
+        streamed = []
+        
+        def print_token(token: str):
+            if not streamed:
+                print("\n===== RESULT =====")
+            streamed.append(token)
+            print(token, end="", flush=True)
+        
         result = await processor.process_request(
             args.request,
+            on_token=print_token,
             language=args.language,
             length=args.length
         )
@@ -165,17 +237,16 @@ async def main():
             print(f"Error: {result['error']}")
             return
         
-        # Display the result
-        ai_messages = [msg for msg in result["messages"] if isinstance(msg, AIMessage)]
-        if ai_messages:
-            print("\n===== RESULT =====")
-            print(ai_messages[-1].content)
+        # Finish the streamed line
+        if streamed:
+            print()
         else:
             print("No output was generated")
     
     finally:
         # Clean up
         await processor.close()
+        await VideoProcessor.shutdown_all()
 
 
 if __name__ == "__main__":
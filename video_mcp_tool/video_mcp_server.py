@@ -5,31 +5,305 @@ Video MCP Server - Provides video transcription and summarization services via M
 
 import os
 import sys
+import asyncio
+import functools
+import importlib.util
+import shutil
 import tempfile
 import base64
-from typing import Optional, Dict, Any
+from typing import Optional, AsyncIterator, Awaitable, Callable, List
 from pydantic import BaseModel
 from mcp.server.fastmcp import FastMCP
 from mcp.server import Server
 import openai
+import httpx
 from dotenv import load_dotenv
-import moviepy.editor as mp
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.routing import Mount, Route
 from mcp.server.sse import SseServerTransport
 import uvicorn
-import requests
 
 # Load environment variables
 load_dotenv()
 
-# Initialize OpenAI client
-openai.api_key = os.getenv("OPENAI_API_KEY")
+# OpenAI credentials, read once at import
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
 # Create MCP server
 mcp = FastMCP("VideoTools")
 
+@functools.lru_cache(maxsize=1)
+def get_openai_client() -> openai.AsyncOpenAI:
+    """
+    Get the shared async OpenAI client, created on first use.
+    
+    One pooled client serves every tool call, so requests reuse keep-alive
+    connections and never block the event loop.
+    
+    Returns:
+        The shared openai.AsyncOpenAI client
+    """
+    return openai.AsyncOpenAI(
+        api_key=OPENAI_API_KEY,
+        http_client=httpx.AsyncClient(
+            # HTTP/2 multiplexes concurrent Whisper/GPT calls when h2 is installed
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=60),
+            timeout=httpx.Timeout(600.0, connect=5.0)
+        )
+    )
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_exe() -> str:
+    """Locate ffmpeg on PATH, falling back to the binary bundled with imageio-ffmpeg."""
+    path = shutil.which("ffmpeg")
+    if path:
+        return path
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception as e:
+        raise RuntimeError(f"ffmpeg not found on PATH and no bundled binary available: {str(e)}")
+
+# Audio is cut into segments of this many seconds, transcribed concurrently
+AUDIO_SEGMENT_SECONDS = int(os.getenv("AUDIO_SEGMENT_SECONDS", "60"))
+
+# Maximum Whisper requests in flight across all tool calls
+WHISPER_MAX_PARALLEL = int(os.getenv("WHISPER_MAX_PARALLEL", "8"))
+_whisper_semaphore = asyncio.Semaphore(WHISPER_MAX_PARALLEL)
+
+# Maximum concurrent ffmpeg processes; encoding is CPU bound, so default to one per core
+FFMPEG_MAX_PARALLEL = int(os.getenv("FFMPEG_MAX_PARALLEL", str(os.cpu_count() or 4)))
+_ffmpeg_semaphore = asyncio.Semaphore(FFMPEG_MAX_PARALLEL)
+
+# Transcript tokens summarized per map call (about ten minutes of speech);
+# estimated from the text length, as there is no tokenizer dependency
+SUMMARY_CHUNK_TOKENS = int(os.getenv("SUMMARY_CHUNK_TOKENS", "2000"))
+CHARS_PER_TOKEN = 4
+
+# Maximum map-step chat completions in flight across all tool calls
+SUMMARY_MAX_PARALLEL = int(os.getenv("SUMMARY_MAX_PARALLEL", "4"))
+_summary_semaphore = asyncio.Semaphore(SUMMARY_MAX_PARALLEL)
+
+# Largest video downloaded from a URL; bigger downloads are rejected
+# from their Content-Length before any of the body is written
+VIDEO_MAX_DOWNLOAD_BYTES = int(os.getenv("VIDEO_MAX_DOWNLOAD_BYTES", str(2 * 1024 * 1024 * 1024)))
+
+async def extract_audio_segments(video_path: str, output_dir: str) -> AsyncIterator[str]:
+    """
+    Extract the audio track of a video as 16 kHz mono Opus segments.
+    
+    One ffmpeg pass skips decoding the video stream, encodes the format Whisper
+    works on and splits it into AUDIO_SEGMENT_SECONDS long Ogg files; at most
+    FFMPEG_MAX_PARALLEL of these run at once across all tool calls. Each
+    segment is yielded as soon as ffmpeg closes it, so callers can upload it
+    while the rest of the video is still being encoded.
+    
+    Args:
+        video_path: Path of the input video
+        output_dir: Directory to write the segments to
+        
+    Yields:
+        Paths of the finished segments, in playback order
+    """
+    async with _ffmpeg_semaphore:
+        proc = await asyncio.create_subprocess_exec(
+            _ffmpeg_exe(), "-nostdin", "-v", "error", "-y",
+            "-i", video_path,
+            "-vn", "-ac", "1", "-ar", "16000",
+            "-c:a", "libopus", "-b:a", "24k",
+            "-f", "segment", "-segment_time", str(AUDIO_SEGMENT_SECONDS),
+            "-segment_format", "ogg", "-reset_timestamps", "1",
+            # ffmpeg prints each segment name on stdout once the segment is complete
+            "-segment_list", "pipe:1", "-segment_list_type", "flat",
+            os.path.join(output_dir, "segment_%05d.ogg"),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        # Drain stderr concurrently so a chatty ffmpeg can never block on a full pipe
+        stderr_task = asyncio.create_task(proc.stderr.read())
+        try:
+            async for line in proc.stdout:
+                name = line.decode().strip()
+                if name:
+                    yield os.path.join(output_dir, name)
+            stderr = await stderr_task
+            await proc.wait()
+            if proc.returncode != 0:
+                raise RuntimeError(f"ffmpeg failed to extract audio: {stderr.decode(errors='replace').strip()}")
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            if not stderr_task.done():
+                stderr_task.cancel()
+
+async def transcribe_audio(audio_path: str) -> str:
+    """
+    Transcribe one audio file with Whisper, within the shared concurrency limit.
+    
+    Args:
+        audio_path: Path of the audio file
+        
+    Returns:
+        The transcript text
+    """
+    async with _whisper_semaphore:
+        with open(audio_path, "rb") as audio_file:
+            transcription = await get_openai_client().audio.transcriptions.create(
+                model="whisper-1",
+                file=audio_file
+            )
+    return transcription.text
+
+async def map_audio_segments(video_path: str, output_dir: str, worker: Callable[[str], Awaitable[str]]) -> List[str]:
+    """
+    Run a coroutine on every audio segment of a video as soon as ffmpeg finishes it.
+    
+    Args:
+        video_path: Path of the input video
+        output_dir: Directory to write the segments to
+        worker: Coroutine function called with each segment path
+        
+    Returns:
+        The worker results, in playback order
+    """
+    tasks = []
+    try:
+        async for segment in extract_audio_segments(video_path, output_dir):
+            tasks.append(asyncio.create_task(worker(segment)))
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+async def download_video(url: str, path: str) -> None:
+    """
+    Stream a video from a URL into a file without holding it in memory.
+    
+    Args:
+        url: HTTP(S) URL of the video
+        path: Path of the file to write
+        
+    Raises:
+        ValueError: If the video is larger than VIDEO_MAX_DOWNLOAD_BYTES
+    """
+    async with httpx.AsyncClient(follow_redirects=True, timeout=httpx.Timeout(60.0, connect=10.0)) as client:
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+            content_length = response.headers.get("Content-Length")
+            if content_length and content_length.isdigit() and int(content_length) > VIDEO_MAX_DOWNLOAD_BYTES:
+                raise ValueError(f"Video too large: {content_length} bytes (limit {VIDEO_MAX_DOWNLOAD_BYTES})")
+            # Count the bytes as they arrive; chunked responses carry no Content-Length
+            received = 0
+            with open(path, "wb") as video_file:
+                async for chunk in response.aiter_bytes(1024 * 1024):
+                    received += len(chunk)
+                    if received > VIDEO_MAX_DOWNLOAD_BYTES:
+                        raise ValueError(f"Video too large: over {VIDEO_MAX_DOWNLOAD_BYTES} bytes")
+                    video_file.write(chunk)
+
+async def complete_chat(system_prompt: str, user_prompt: str, max_tokens: int) -> str:
+    """
+    Run one chat completion with the shared OpenAI client.
+    
+    Args:
+        system_prompt: System message content
+        user_prompt: User message content
+        max_tokens: Maximum tokens in the reply
+        
+    Returns:
+        The reply text
+    """
+    response = await get_openai_client().chat.completions.create(
+        model="gpt-4o",
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ],
+        max_tokens=max_tokens
+    )
+    return response.choices[0].message.content or ""
+
+def chunk_transcripts(texts: List[str], max_tokens: int = SUMMARY_CHUNK_TOKENS) -> List[str]:
+    """
+    Join consecutive segment transcripts into chunks of about max_tokens tokens.
+    
+    Whisper segments are short, so summarizing each one on its own would spend
+    a chat call on a few sentences; chunks span several minutes of speech.
+    
+    Args:
+        texts: Segment transcripts, in playback order
+        max_tokens: Estimated token budget of each chunk
+        
+    Returns:
+        The non-empty chunks, in playback order
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    chunks = []
+    current = []
+    size = 0
+    for text in texts:
+        text = text.strip()
+        if not text:
+            continue
+        if current and size + len(text) > max_chars:
+            chunks.append(" ".join(current))
+            current = []
+            size = 0
+        current.append(text)
+        size += len(text) + 1
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+async def summarize_chunk(text: str) -> str:
+    """
+    Map step of video summarization: summarize one chunk of the transcript.
+    
+    At most SUMMARY_MAX_PARALLEL of these run at once across all tool calls.
+    
+    Args:
+        text: Transcript chunk
+        
+    Returns:
+        Summary of the chunk
+    """
+    async with _summary_semaphore:
+        return await complete_chat(
+            "You are a helpful assistant that summarizes parts of video transcripts.",
+            f"Summarize this part of a video transcript, keeping every key point:\n\n{text}",
+            300
+        )
+
+# Base64 characters read per slice
+BASE64_DECODE_CHUNK = 4 * 1024 * 1024
+
+def write_base64_to_file(data: str, file) -> None:
+    """
+    Decode base64 data into a file slice by slice.
+    
+    Only one decoded slice is held in memory at a time, instead of a full
+    copy of the video next to the base64 string. Line breaks (as in MIME or
+    `base64` CLI output) are dropped first, and characters past the last
+    whole 4-character group are carried into the next slice.
+    
+    Args:
+        data: Base64-encoded data
+        file: Binary file object to write the decoded bytes to
+    """
+    carry = ""
+    for start in range(0, len(data), BASE64_DECODE_CHUNK):
+        chars = carry + "".join(data[start:start + BASE64_DECODE_CHUNK].split())
+        whole = len(chars) - len(chars) % 4
+        file.write(base64.b64decode(chars[:whole]))
+        carry = chars[whole:]
+    if carry:
+        # Leftover characters are malformed input; let b64decode report them
+        file.write(base64.b64decode(carry))
+
 class VideoTranscriptionRequest(BaseModel):
     video_data_base64: Optional[str] = None
     video_path: Optional[str] = None
@@ -47,6 +321,13 @@ class VideoSummarizationResponse(BaseModel):
     summary: str
     error: Optional[str] = None
 
+# Shape and token budget of the final summary for each requested length
+SUMMARY_LENGTHS = {
+    "short": ("a few sentences", 200),
+    "medium": ("two or three paragraphs", 500),
+    "long": ("a detailed, multi-paragraph summary", 1200)
+}
+
 @mcp.tool()
 async def transcribe_video(request: VideoTranscriptionRequest) -> VideoTranscriptionResponse:
     """
@@ -59,17 +340,14 @@ async def transcribe_video(request: VideoTranscriptionRequest) -> VideoTranscrip
         An object containing the transcript and any error messages.
     """
     try:
-        temp_audio = None
+        temp_audio_dir = None
         temp_video = None
         
         if request.video_data_base64:
-            # Decode base64 video data
-            video_data = base64.b64decode(request.video_data_base64)
-            
-            # Create temporary video file
+            # Decode base64 video data into a temporary video file
             with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as temp_video_file:
                 temp_video = temp_video_file.name
-                temp_video_file.write(video_data)
+                await asyncio.to_thread(write_base64_to_file, request.video_data_base64, temp_video_file)
             
             video_path = temp_video
         elif request.video_path:
@@ -88,22 +366,12 @@ async def transcribe_video(request: VideoTranscriptionRequest) -> VideoTranscrip
                 error="Either video_data_base64 or video_path must be provided"
             )
         
-        # Extract audio from video
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_audio_file:
-            temp_audio = temp_audio_file.name
+        # Extract audio from video into a scratch directory
+        temp_audio_dir = tempfile.mkdtemp(prefix="video_audio_")
         
-        video = mp.VideoFileClip(video_path)
-        video.audio.write_audiofile(temp_audio, verbose=False, logger=None)
-        
-        # Transcribe audio using OpenAI's Whisper model
-        with open(temp_audio, "rb") as audio_file:
-            client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-            transcription = client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file
-            )
-        
-        transcript_text = transcription.text
+        # Transcribe each segment with OpenAI's Whisper model as soon as ffmpeg finishes it
+        texts = await map_audio_segments(video_path, temp_audio_dir, transcribe_audio)
+        transcript_text = " ".join(text.strip() for text in texts if text.strip())
         
         return VideoTranscriptionResponse(transcript=transcript_text)
         
@@ -114,8 +382,8 @@ async def transcribe_video(request: VideoTranscriptionRequest) -> VideoTranscrip
         )
     finally:
         # Clean up temporary files
-        if temp_audio and os.path.exists(temp_audio):
-            os.unlink(temp_audio)
+        if temp_audio_dir:
+            shutil.rmtree(temp_audio_dir, ignore_errors=True)
         if temp_video and os.path.exists(temp_video):
             os.unlink(temp_video)
 
@@ -131,8 +399,7 @@ async def summarize_video_transcript(transcript: str) -> str:
         A summary of the transcript
     """
     try:
-        client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        response = client.chat.completions.create(
+        response = await get_openai_client().chat.completions.create(
             model="gpt-4o",
             messages=[
                 {"role": "system", "content": "You are a helpful assistant that summarizes video transcripts."},
@@ -150,38 +417,76 @@ async def summarize_video(request: VideoSummarizationRequest) -> VideoSummarizat
     """
     Summarize a video from a given URL.
     
+    The video is downloaded and its audio segments are transcribed concurrently
+    as ffmpeg produces them. The transcript is split into chunks of several
+    minutes that are summarized concurrently (map), and the partial summaries
+    are combined into the final summary (reduce). A transcript that fits in a
+    single chunk is summarized directly.
+    
     Args:
-        request: An object containing the video URL and optional parameters.
+        request: An object containing the video URL (or a local file path) and optional parameters.
         
     Returns:
         An object containing the summary and any error messages.
     """
+    temp_dir = None
     try:
-        # Get API key from environment variables
-        api_key = os.getenv("OPENAI_API_KEY")
+        print(f"Processing video URL: {request.video_url}")
+        print(f"Parameters - Language: {request.language}, Length: {request.length}")
+        
+        shape, max_tokens = SUMMARY_LENGTHS.get(request.length, SUMMARY_LENGTHS["medium"])
+        temp_dir = tempfile.mkdtemp(prefix="video_summary_")
         
-        if not api_key:
-            error_msg = "OPENAI_API_KEY not found in environment variables"
-            print(f"ERROR: {error_msg}")
+        # Download remote videos; local paths are used in place
+        if request.video_url.startswith(("http://", "https://")):
+            video_path = os.path.join(temp_dir, "video")
+            await download_video(request.video_url, video_path)
+        elif os.path.exists(request.video_url):
+            video_path = request.video_url
+        else:
             return VideoSummarizationResponse(
                 summary="",
-                error=error_msg
+                error=f"Video file does not exist at path: {request.video_url}"
             )
         
-        print(f"Processing video URL: {request.video_url}")
-        print(f"Parameters - Language: {request.language}, Length: {request.length}")
+        # Transcribe each segment as soon as ffmpeg finishes it
+        texts = await map_audio_segments(video_path, temp_dir, transcribe_audio)
+        chunks = chunk_transcripts(texts)
+        if not chunks:
+            return VideoSummarizationResponse(
+                summary="",
+                error="No speech found in the video"
+            )
         
-        # For now, return a mock response
-        # In production, you would download the video, transcribe it, and then summarize
+        if len(chunks) == 1:
+            summary = await complete_chat(
+                "You are a helpful assistant that summarizes videos.",
+                f"Summarize this video transcript in {shape}, written in the language "
+                f"'{request.language}'.\n\n{chunks[0]}",
+                max_tokens
+            )
+            return VideoSummarizationResponse(
+                summary=summary
+            )
+        
+        # Map: summarize the transcript chunks concurrently
+        partial_summaries = [
+            summary.strip()
+            for summary in await asyncio.gather(*(summarize_chunk(chunk) for chunk in chunks))
+            if summary.strip()
+        ]
         
-        # Mock summary based on URL
-        mock_summary = f"This is a mock summary of the video at {request.video_url}. "
-        mock_summary += "The video discusses key concepts in artificial intelligence and machine learning. "
-        mock_summary += "It covers topics like neural networks, deep learning, and practical applications. "
-        mock_summary += f"This summary is in {request.language} language and is of {request.length} length."
+        # Reduce: combine the partial summaries in playback order
+        parts = "\n\n".join(f"Part {index}: {summary}" for index, summary in enumerate(partial_summaries, 1))
+        summary = await complete_chat(
+            "You are a helpful assistant that summarizes videos.",
+            f"Below are summaries of consecutive parts of one video. Combine them into {shape} "
+            f"of the whole video, written in the language '{request.language}'.\n\n{parts}",
+            max_tokens
+        )
         
         return VideoSummarizationResponse(
-            summary=mock_summary
+            summary=summary
         )
         
     except Exception as e:
@@ -193,6 +498,10 @@ async def summarize_video(request: VideoSummarizationRequest) -> VideoSummarizat
             summary="",
             error=error_msg
         )
+    finally:
+        # Clean up the downloaded video and audio segments
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
 def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlette:
     """Create a Starlette app with SSE transport for the MCP server."""
@@ -221,14 +530,13 @@ def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlett
 def main():
     import argparse
 
-    # Check API credentials at startup
-    api_key = os.getenv("OPENAI_API_KEY")
-    
+    # Check API credentials at startup; every tool needs them
     print("\nVideo MCP Server - Credential Check:")
-    if api_key:
+    if OPENAI_API_KEY:
         print("✓ OPENAI_API_KEY: Present (not showing for security)")
     else:
         print("✗ OPENAI_API_KEY: Not found in environment variables")
+        sys.exit(1)
     
     # Get MCP server instance from FastMCP
     mcp_server = mcp._mcp_server